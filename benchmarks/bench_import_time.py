@@ -0,0 +1,63 @@
+"""
+Import-time benchmark for ``import nosible`` and ``from nosible import Nosible``.
+
+Runs each import in a fresh interpreter with ``python -X importtime`` and reports the total
+cumulative time and the slowest top-level dependencies. Exits non-zero if ``import nosible`` pulls
+in any of the heavy dependencies that should only load on first use, so it can guard regressions.
+
+Run with::
+
+    python benchmarks/bench_import_time.py
+"""
+
+import subprocess
+import sys
+
+# Must not be imported by a bare `import nosible`.
+DEFERRED = ("httpx", "tenacity", "pyrate_limiter", "polars", "duckdb", "openai", "cryptography")
+
+
+def importtime(statement: str) -> tuple:
+    """
+    Return ``(total_us, {top_level_module: cumulative_us})`` for `statement` in a fresh interpreter.
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement], capture_output=True, text=True, check=True
+    )
+    modules = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        if not cumulative.strip().isdigit() or name.startswith("  "):
+            continue
+        # Only top-level entries (one leading space): their cumulative times don't overlap.
+        modules[name.strip()] = int(cumulative)
+    return sum(modules.values()), modules
+
+
+def report(statement: str, repeat: int = 5) -> dict:
+    runs = [importtime(statement) for _ in range(repeat)]
+    total, modules = min(runs, key=lambda r: r[0])
+    print(f"{statement!r}: {total / 1e3:.1f} ms (best of {repeat})")
+    for name, us in sorted(modules.items(), key=lambda kv: -kv[1])[:5]:
+        print(f"    {us / 1e3:8.1f} ms  {name}")
+    return modules
+
+
+if __name__ == "__main__":
+    report("import nosible")
+    report("from nosible import Nosible")
+    leaked = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"import sys, nosible; print(' '.join(m for m in {DEFERRED!r} if m in sys.modules))",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.split()
+    if leaked:
+        sys.exit(f"`import nosible` eagerly imported: {', '.join(leaked)}")
+    print("import nosible defers:", ", ".join(DEFERRED))
@@ -0,0 +1,69 @@
+"""
+Micro-benchmark: decoding search API responses.
+
+Compares ``httpx.Response.json()`` (stdlib json on decoded text) with ``json_loads(response.content)``
+(orjson on the raw bytes), as used by ``Nosible._decode_json``, on realistic 100-result (fast search)
+and 10,000-result (bulk search) payloads.
+
+Run with::
+
+    python benchmarks/bench_json_decode.py
+"""
+
+import json
+import random
+import string
+import timeit
+
+import httpx
+
+from nosible.utils.json_tools import _use_orjson, json_loads
+
+
+def _text(n_words: int) -> str:
+    return " ".join("".join(random.choices(string.ascii_lowercase, k=random.randint(2, 10))) for _ in range(n_words))
+
+
+def make_payload(n_results: int) -> bytes:
+    """
+    Build a response body shaped like the search API's, with roughly 2 KB of content per result.
+    """
+    random.seed(0)
+    results = [
+        {
+            "url": f"https://example{i}.com/{_text(3).replace(' ', '-')}",
+            "title": _text(10),
+            "description": _text(30),
+            "netloc": f"example{i}.com",
+            "published": "2024-05-01",
+            "visited": "2024-05-02",
+            "author": _text(2),
+            "content": _text(300),
+            "language": "en",
+            "similarity": random.random(),
+            "url_hash": "".join(random.choices(string.hexdigits, k=16)),
+            "brand_safety": "safe",
+            "country": "United States",
+            "sector": "Financials",
+        }
+        for i in range(n_results)
+    ]
+    return json.dumps({"response": results}).encode()
+
+
+def bench(n_results: int, repeat: int) -> None:
+    body = make_payload(n_results)
+    response = httpx.Response(200, content=body, headers={"Content-Type": "application/json"})
+    stdlib = min(timeit.repeat(lambda: httpx.Response(200, content=body).json(), number=1, repeat=repeat))
+    fast = min(timeit.repeat(lambda: json_loads(response.content), number=1, repeat=repeat))
+    print(
+        f"{n_results:>6} results ({len(body) / 1e6:6.2f} MB): "
+        f"response.json() {stdlib * 1e3:8.2f} ms | json_loads(content) {fast * 1e3:8.2f} ms | "
+        f"{stdlib / fast:4.1f}x"
+    )
+
+
+if __name__ == "__main__":
+    print(f"orjson available: {_use_orjson}")
+    bench(100, repeat=50)
+    bench(10_000, repeat=5)
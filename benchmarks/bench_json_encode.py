@@ -0,0 +1,47 @@
+"""
+Micro-benchmark: serializing a ResultSet to JSON.
+
+Compares the previous approach (``Result.to_dict`` via ``dataclasses.asdict`` for every result, a
+recursive copy to coerce dict keys to str, then ``orjson.dumps(...).decode()``) with
+``json_dumps_bytes(results)``, which lets orjson serialize the dataclasses directly with
+``OPT_NON_STR_KEYS``, on 100 and 10,000 results.
+
+Run with::
+
+    python benchmarks/bench_json_encode.py
+"""
+
+import timeit
+
+import orjson
+from bench_json_decode import make_payload
+
+from nosible import ResultSet
+from nosible.utils.json_tools import json_dumps_bytes, json_loads
+
+
+def _ensure_str_keys(o):
+    if isinstance(o, dict):
+        return {str(k): _ensure_str_keys(v) for k, v in o.items()}
+    if isinstance(o, list):
+        return [_ensure_str_keys(i) for i in o]
+    return o
+
+
+def legacy(rs: ResultSet) -> str:
+    return orjson.dumps(_ensure_str_keys(rs.to_dicts())).decode("utf-8")
+
+
+def bench(n_results: int, repeat: int) -> None:
+    rs = ResultSet.from_dicts(json_loads(make_payload(n_results))["response"])
+    old = min(timeit.repeat(lambda: legacy(rs), number=1, repeat=repeat))
+    new = min(timeit.repeat(lambda: json_dumps_bytes(rs.results), number=1, repeat=repeat))
+    print(
+        f"{n_results:>6} results: to_dicts + str keys + dumps {old * 1e3:8.2f} ms | "
+        f"json_dumps_bytes {new * 1e3:8.2f} ms | {old / new:5.1f}x"
+    )
+
+
+if __name__ == "__main__":
+    bench(100, repeat=50)
+    bench(10_000, repeat=5)
@@ -0,0 +1,37 @@
+"""
+Micro-benchmark: turning a search API response into a ``ResultSet``.
+
+Compares ``ResultSet.from_dicts(json_loads(body)["response"])`` (generic dicts, then Result objects)
+with ``ResultSet.from_json(body)``, which decodes straight into typed records when msgspec is
+installed, on 100-result (fast search) and 10,000-result (bulk search) payloads.
+
+Run with::
+
+    python benchmarks/bench_result_decode.py
+"""
+
+import timeit
+
+from bench_json_decode import make_payload
+
+from nosible import ResultSet
+from nosible.classes.result_set import _msgspec_decoder
+from nosible.utils.json_tools import json_loads
+
+
+def bench(n_results: int, repeat: int) -> None:
+    body = make_payload(n_results)
+    dicts = min(
+        timeit.repeat(lambda: ResultSet.from_dicts(json_loads(body)["response"]), number=1, repeat=repeat)
+    )
+    typed = min(timeit.repeat(lambda: ResultSet.from_json(body), number=1, repeat=repeat))
+    print(
+        f"{n_results:>6} results ({len(body) / 1e6:6.2f} MB): "
+        f"from_dicts {dicts * 1e3:8.2f} ms | from_json {typed * 1e3:8.2f} ms | {dicts / typed:4.1f}x"
+    )
+
+
+if __name__ == "__main__":
+    print(f"msgspec available: {_msgspec_decoder() is not None}")
+    bench(100, repeat=50)
+    bench(10_000, repeat=5)
@@ -15,6 +15,8 @@ Result : nosible.classes.result.Result
     Class for handling individual search results.
 ResultSet : nosible.classes.result_set.ResultSet
     Class for processing sets of search results.
+LazyResultSet : nosible.classes.lazy_result_set.LazyResultSet
+    Class for deferred queries over saved result sets.
 Snippet : nosible.classes.snippet.Snippet
     Class representing a snippet of information.
 SnippetSet : nosible.classes.snippet_set.SnippetSet
@@ -23,16 +25,36 @@ WebPageData : nosible.classes.web_page.WebPageData
     Class representing web page data.
 
 """
-from nosible.classes.result import Result
-from nosible.classes.result_set import ResultSet
-from nosible.classes.search import Search
-from nosible.classes.search_set import SearchSet
-from nosible.classes.snippet import Snippet
-from nosible.classes.snippet_set import SnippetSet
-from nosible.classes.web_page import WebPageData
-from nosible.nosible_client import Nosible
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from nosible.classes.lazy_result_set import LazyResultSet
+    from nosible.classes.result import Result
+    from nosible.classes.result_set import ResultSet
+    from nosible.classes.search import Search
+    from nosible.classes.search_set import SearchSet
+    from nosible.classes.snippet import Snippet
+    from nosible.classes.snippet_set import SnippetSet
+    from nosible.classes.web_page import WebPageData
+    from nosible.nosible_client import Nosible
+
+# Public names are imported on first access (PEP 562), so `import nosible` stays cheap for
+# short-lived processes; the client and its HTTP stack only load when `Nosible` is used.
+_LAZY_ATTRS = {
+    "LazyResultSet": "nosible.classes.lazy_result_set",
+    "Nosible": "nosible.nosible_client",
+    "Result": "nosible.classes.result",
+    "ResultSet": "nosible.classes.result_set",
+    "Search": "nosible.classes.search",
+    "SearchSet": "nosible.classes.search_set",
+    "Snippet": "nosible.classes.snippet",
+    "SnippetSet": "nosible.classes.snippet_set",
+    "WebPageData": "nosible.classes.web_page",
+}
 
 __all__ = [
+    "LazyResultSet",
     "Nosible",
     "Result",
     "ResultSet",
@@ -42,3 +64,17 @@ __all__ = [
     "SnippetSet",
     "WebPageData",
 ]
+
+
+def __getattr__(name: str):
+    module = _LAZY_ATTRS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    # Cache on the package so later lookups bypass this hook.
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Union
+
+if TYPE_CHECKING:
+    import polars as pl
+
+    from nosible.classes.result_set import ResultSet
+
+    Filters = Union[pl.Expr, list[pl.Expr], dict]
+
+
+def _to_predicates(filters: Filters | None) -> list[pl.Expr]:
+    """
+    Normalise the accepted filter forms into a list of Polars predicates.
+
+    Parameters
+    ----------
+    filters : pl.Expr, list of pl.Expr, dict or None
+        A single predicate, several predicates (combined with AND), or a mapping of column
+        name to a value (equality) or a list/tuple/set of values (membership).
+
+    Returns
+    -------
+    list of pl.Expr
+        The predicates to apply.
+
+    Raises
+    ------
+    TypeError
+        If `filters` is not one of the supported forms.
+
+    Examples
+    --------
+    >>> import polars as pl
+    >>> len(_to_predicates({"netloc": "a.com", "language": ["en", "fr"]}))
+    2
+    >>> _to_predicates(None)
+    []
+    >>> _to_predicates("netloc = 'a.com'")  # doctest: +IGNORE_EXCEPTION_DETAIL
+    Traceback (most recent call last):
+    TypeError: filters must be a Polars expression, a list of expressions, or a dict.
+    """
+    import polars as pl
+
+    if filters is None:
+        return []
+    if isinstance(filters, pl.Expr):
+        return [filters]
+    if isinstance(filters, dict):
+        predicates = []
+        for column, value in filters.items():
+            if isinstance(value, (list, tuple, set)):
+                predicates.append(pl.col(column).is_in(list(value)))
+            else:
+                predicates.append(pl.col(column) == value)
+        return predicates
+    if isinstance(filters, list) and all(isinstance(f, pl.Expr) for f in filters):
+        return list(filters)
+    raise TypeError("filters must be a Polars expression, a list of expressions, or a dict.")
+
+
+@dataclass(frozen=True)
+class LazyResultSet:
+    """
+    A deferred query over one or more saved ResultSets.
+
+    Nothing is read from disk until `collect` or `to_polars` is called; filters and column
+    selections are pushed down into the Parquet/IPC scan so only the matching row groups and
+    columns are loaded. Instances are usually created with `ResultSet.scan`.
+
+    Parameters
+    ----------
+    frame : pl.LazyFrame
+        The Polars query plan backing this set.
+
+    Examples
+    --------
+    >>> import polars as pl
+    >>> from nosible import Result, ResultSet
+    >>> _ = ResultSet([Result(url="https://a.com", netloc="a.com", similarity=0.9)]).write_parquet("a.parquet")
+    >>> _ = ResultSet([Result(url="https://b.org", netloc="b.org", similarity=0.4)]).write_parquet("b.parquet")
+    >>> lazy = ResultSet.scan("[ab].parquet").filter(pl.col("similarity") > 0.5)
+    >>> [r.url for r in lazy.collect()]
+    ['https://a.com']
+    """
+
+    frame: pl.LazyFrame
+    """ The Polars query plan backing this set."""
+
+    def filter(self, filters: Filters) -> LazyResultSet:
+        """
+        Narrow the set down to the rows matching `filters`.
+
+        Parameters
+        ----------
+        filters : pl.Expr, list of pl.Expr or dict
+            A predicate, several predicates (combined with AND), or a mapping of column name to a
+            value or collection of values.
+
+        Returns
+        -------
+        LazyResultSet
+            A new lazy set with the filters applied.
+        """
+        frame = self.frame
+        for predicate in _to_predicates(filters):
+            frame = frame.filter(predicate)
+        return LazyResultSet(frame)
+
+    def select(self, columns: list[str]) -> LazyResultSet:
+        """
+        Only read the given columns.
+
+        Parameters
+        ----------
+        columns : list of str
+            Result fields to keep.
+
+        Returns
+        -------
+        LazyResultSet
+            A new lazy set projecting `columns`.
+        """
+        return LazyResultSet(self.frame.select(columns))
+
+    def head(self, n: int = 10) -> LazyResultSet:
+        """
+        Limit the set to its first `n` rows.
+
+        Parameters
+        ----------
+        n : int
+            Number of rows to keep.
+
+        Returns
+        -------
+        LazyResultSet
+            A new lazy set with at most `n` rows.
+        """
+        return LazyResultSet(self.frame.head(n))
+
+    def to_polars(self) -> pl.DataFrame:
+        """
+        Execute the query and return the matching rows as a Polars DataFrame.
+
+        Returns
+        -------
+        pl.DataFrame
+            The materialised rows.
+
+        Raises
+        ------
+        RuntimeError
+            If the scan or query fails.
+        """
+        try:
+            return self.frame.collect()
+        except Exception as e:
+            raise RuntimeError(f"Failed to scan saved results: {e}") from e
+
+    def collect(self) -> ResultSet:
+        """
+        Execute the query and load the matching rows into a ResultSet.
+
+        Returns
+        -------
+        ResultSet
+            The materialised results.
+
+        Raises
+        ------
+        RuntimeError
+            If the scan or query fails.
+        """
+        from nosible.classes.result_set import ResultSet
+
+        return ResultSet.from_polars(self.to_polars())
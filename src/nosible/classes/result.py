@@ -284,7 +284,8 @@ class Result:
         Parameters
         ----------
         client : Nosible
-            An instance of your Nosible client with `.llm_api_key` on it.
+            An instance of your Nosible client with `.llm_api_key` on it. Its pooled
+            `llm_client` is used for the request.
 
         Returns
         -------
@@ -355,11 +356,8 @@ class Result:
 
             The response must be a float in [-1.0, 1.0]. No other text must be returned.
         """
-        from openai import OpenAI
-        llm_client = OpenAI(base_url="https://openrouter.ai/api/v1", api_key=client.llm_api_key)
-
-        # Call the chat completions endpoint.
-        resp = llm_client.chat.completions.create(
+        # Call the chat completions endpoint on the client's pooled LLM client.
+        resp = client.llm_client.chat.completions.create(
             model=client.sentiment_model, messages=[{"role": "user", "content": prompt.strip()}], temperature=0.7
         )
 
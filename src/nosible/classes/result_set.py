@@ -1,15 +1,102 @@
 from __future__ import annotations
 
+import functools
+import os
+import threading
 from collections.abc import Iterator
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, BinaryIO, Optional, Union
 
+from nosible.classes.lazy_result_set import LazyResultSet
 from nosible.classes.result import Result
-from nosible.utils.json_tools import json_dumps, json_loads
+from nosible.utils.json_tools import json_dumps, json_dumps_bytes, json_loads
 
 if TYPE_CHECKING:
+    import duckdb
     import pandas as pd
     import polars as pl
+    import pyarrow as pa
+
+    from nosible.classes.lazy_result_set import Filters
+
+# In-process DuckDB database shared by every ResultSet.sql() call.
+_duckdb_con: duckdb.DuckDBPyConnection | None = None
+_duckdb_lock = threading.Lock()
+
+
+# Result fields read from API responses (see `ResultSet.from_dicts`).
+_RESPONSE_FIELDS = (
+    "url",
+    "title",
+    "description",
+    "netloc",
+    "published",
+    "visited",
+    "author",
+    "content",
+    "language",
+    "url_hash",
+)
+# The same fields plus similarity, in `Result` field order.
+_RESULT_FIELDS_FROM_RESPONSE = (*_RESPONSE_FIELDS[:-1], "similarity", "url_hash")
+
+
+@functools.lru_cache(maxsize=None)
+def _msgspec_decoder():
+    """
+    Build a typed msgspec decoder for search API responses.
+
+    The schema is defined once; the decoder parses response bytes straight into compact structs
+    in C, without building intermediate dicts. Record fields follow the leading fields of `Result`,
+    so each record converts to a Result positionally.
+
+    Returns
+    -------
+    types.SimpleNamespace or None
+        The ``decoder``, its ``DecodeError``, ``astuple`` and the ``UNSET`` marker, or None when
+        msgspec is not installed.
+    """
+    try:
+        import msgspec
+    except ImportError:
+        return None
+
+    import types
+
+    semantics = msgspec.defstruct("Semantics", [("similarity", Optional[float], None)])
+    # Unlike the other fields, a missing similarity falls back to semantics.similarity.
+    fields_ = [
+        (name, Optional[str], None)
+        if name != "similarity"
+        else (name, Union[float, None, msgspec.UnsetType], msgspec.UNSET)
+        for name in _RESULT_FIELDS_FROM_RESPONSE
+    ]
+    record = msgspec.defstruct("ResultRecord", fields_ + [("semantics", Optional[semantics], None)])
+    response = msgspec.defstruct("SearchResponse", [("response", list[record], [])])
+    return types.SimpleNamespace(
+        decoder=msgspec.json.Decoder(response),
+        DecodeError=msgspec.DecodeError,
+        astuple=msgspec.structs.astuple,
+        UNSET=msgspec.UNSET,
+    )
+
+
+def _duckdb_connection() -> duckdb.DuckDBPyConnection:
+    """
+    Return the shared in-memory DuckDB connection, creating it on first use.
+
+    Returns
+    -------
+    duckdb.DuckDBPyConnection
+        The process-wide connection.
+    """
+    global _duckdb_con
+    with _duckdb_lock:
+        if _duckdb_con is None:
+            import duckdb
+
+            _duckdb_con = duckdb.connect(database=":memory:")
+        return _duckdb_con
 
 
 @dataclass(frozen=True)
@@ -76,6 +163,8 @@ class ResultSet(Iterator[Result]):
     """ List of Result objects contained in this ResultSet."""
     _index: int = field(default=0, init=False, repr=False, compare=False)
     """ Internal index for iteration over results."""
+    _frame: pl.DataFrame | None = field(default=None, init=False, repr=False, compare=False)
+    """ Cached Polars view of the results, built on first conversion."""
 
     def __len__(self) -> int:
         """
@@ -254,7 +343,7 @@ class ResultSet(Iterator[Result]):
             return ResultSet(self.results + other.results)
         if isinstance(other, Result):
             # If other is a single Result, create a new ResultSet with it
-            return ResultSet(self.results.append(other))
+            return ResultSet(self.results + [other])
         raise TypeError("Can only concatenate ResultSet with another ResultSet.")
 
     def __sub__(self, other: ResultSet) -> ResultSet:
@@ -513,6 +602,139 @@ class ResultSet(Iterator[Result]):
         sorted_vc = vc.sort(count_col, descending=True)
         return {str(row[0]): int(row[1]) for row in sorted_vc.rows()}
 
+    def sentiment(
+        self,
+        client,
+        batch_size: int = 10,
+        concurrency: int = 4,
+        cache: bool = False,
+        cache_path: str | None = None,
+    ) -> list[float]:
+        """
+        Score the sentiment of every Result in the set with your LLM client.
+
+        Results are packed `batch_size` to a prompt and the prompts are sent concurrently over a
+        single LLM client. With `cache=True`, scores are cached on disk by `url_hash` and sentiment
+        model, so repeated runs over the same results do not call the LLM again.
+
+        Parameters
+        ----------
+        client : Nosible
+            An instance of your Nosible client with `.llm_api_key` on it. Its pooled
+            `llm_client` is shared by all requests.
+        batch_size : int, optional
+            How many results to score per LLM request.
+        concurrency : int, optional
+            Maximum number of LLM requests in flight at once.
+        cache : bool, optional
+            Read and write cached scores. Off by default.
+        cache_path : str, optional
+            SQLite file holding the cache. Defaults to `sentiment.sqlite` in the nosible cache
+            directory (`$NOSIBLE_CACHE_DIR` or `~/.cache/nosible`).
+
+        Returns
+        -------
+        list of float
+            Sentiment scores in [-1.0, 1.0], in the same order as the results.
+
+        Raises
+        ------
+        ValueError
+            If `client` or `client.llm_api_key` is missing, or if the LLM response is not a list of
+            floats in [-1.0, 1.0] with one score per result.
+
+        Examples
+        --------
+        >>> from nosible import Nosible, Result, ResultSet  # doctest: +SKIP
+        >>> results = ResultSet([Result(url_hash="a", content="Great!"), Result(url_hash="b", content="Awful.")])
+        >>> with Nosible() as nos:  # doctest: +SKIP
+        ...     results.sentiment(client=nos)  # doctest: +SKIP
+        [0.9, -0.8]
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        from nosible.utils.disk_cache import DiskCache, default_cache_dir
+
+        if client is None:
+            raise ValueError("A Nosible client instance must be provided as 'client'.")
+        if not client.llm_api_key:
+            raise ValueError("LLM API key is required for getting result sentiment.")
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1.")
+
+        model = client.sentiment_model
+        scores: list[float | None] = [None] * len(self.results)
+
+        store = None
+        if cache:
+            store = DiskCache(cache_path or os.path.join(default_cache_dir(), "sentiment.sqlite"))
+            keys = {i: f"{r.url_hash}:{model}" for i, r in enumerate(self.results) if r.url_hash}
+            cached = store.get_many(list(set(keys.values())))
+            for i, key in keys.items():
+                scores[i] = cached.get(key)
+
+        pending = [i for i, score in enumerate(scores) if score is None]
+        batches = [pending[start : start + batch_size] for start in range(0, len(pending), batch_size)]
+
+        # Every batch goes through the client's pooled LLM client.
+        llm_client = client.llm_client
+
+        def score_batch(batch: list[int]) -> list[float]:
+            texts = "\n\n".join(
+                f"## Text {n + 1}\n{(self.results[i].content or '').strip()}" for n, i in enumerate(batch)
+            )
+            prompt = f"""
+                # TASK DESCRIPTION
+                On a scale from -1.0 (very negative) to 1.0 (very positive),
+                please rate the sentiment of each of the {len(batch)} texts below.
+
+                # TEXTS
+
+                {texts}
+
+                # RESPONSE FORMAT
+
+                The response must be a JSON list of {len(batch)} floats in [-1.0, 1.0], one per text, in
+                the order the texts are given. No other text must be returned.
+            """
+            resp = llm_client.chat.completions.create(
+                model=model, messages=[{"role": "user", "content": prompt.strip()}], temperature=0.7
+            )
+            raw = resp.choices[0].message.content.strip()
+
+            # Strip any leading/trailing markdown ``` fences.
+            if raw.startswith("```"):
+                raw = raw.strip("`").strip()
+                if raw.lower().startswith("json"):
+                    raw = raw[len("json") :].strip()
+
+            try:
+                batch_scores = [float(x) for x in json_loads(raw)]
+            except Exception as e:
+                raise ValueError(f"Sentiment response is not a list of floats: {raw!r}") from e
+            if len(batch_scores) != len(batch):
+                raise ValueError(f"Expected {len(batch)} sentiment scores, got {len(batch_scores)}: {raw!r}")
+            for score in batch_scores:
+                if not -1.0 <= score <= 1.0:
+                    raise ValueError(f"Sentiment {score} outside valid range [-1.0, 1.0]")
+            return batch_scores
+
+        try:
+            with ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
+                for batch, batch_scores in zip(batches, pool.map(score_batch, batches)):
+                    fresh = {}
+                    for i, score in zip(batch, batch_scores):
+                        scores[i] = score
+                        if self.results[i].url_hash:
+                            fresh[f"{self.results[i].url_hash}:{model}"] = score
+                    if store is not None:
+                        store.set_many(fresh)
+        finally:
+            if store is not None:
+                store.close()
+
+        return scores
+
     # Conversion methods
     def write_csv(self, file_path: str | None = None, delimiter: str = ",", encoding: str = "utf-8") -> str:
         """
@@ -570,6 +792,11 @@ class ResultSet(Iterator[Result]):
         """
         Convert the search results to a Polars DataFrame.
 
+        The DataFrame is built once and cached on the ResultSet, so repeated calls (and methods
+        built on top of it such as `analyze`, `to_pandas` or `write_parquet`) reuse the same data.
+        Each call returns a cheap clone, so mutating the returned frame never touches the cache.
+        Call `invalidate_cache` after changing `results` (appending, replacing or editing a Result).
+
         Returns
         -------
         pl.DataFrame
@@ -588,17 +815,53 @@ class ResultSet(Iterator[Result]):
         True
         >>> "url" in df.columns
         True
+        >>> search_results.to_polars() is df
+        False
         """
         # Lazy import for runtime, but allow static type checking
 
         import polars as pl
 
-        return pl.DataFrame(self.to_dicts())
+        frame = self._frame
+        if frame is None:
+            frame = pl.DataFrame(self.to_dicts(), schema_overrides={"similarity": pl.Float64})
+            # Type all-null columns as strings, so saved files can be scanned together.
+            frame = frame.with_columns(pl.col(pl.Null).cast(pl.Utf8))
+            object.__setattr__(self, "_frame", frame)
+        return frame.clone()
 
-    def to_pandas(self) -> pd.DataFrame:
+    def invalidate_cache(self) -> None:
+        """
+        Drop the cached DataFrame view of the results.
+
+        Call this after appending to, replacing or editing `results` in place, so the next
+        conversion reflects the change.
+
+        Examples
+        --------
+        >>> from nosible import Result, ResultSet
+        >>> search_results = ResultSet([Result(url="https://example.com", title="Example Domain")])
+        >>> search_results.to_polars()["title"].to_list()
+        ['Example Domain']
+        >>> search_results.results[0].title = "Renamed"
+        >>> search_results.invalidate_cache()
+        >>> search_results.to_polars()["title"].to_list()
+        ['Renamed']
+        """
+        object.__setattr__(self, "_frame", None)
+
+    def to_pandas(self, zero_copy: bool = False) -> pd.DataFrame:
         """
         Convert the search results to a pandas DataFrame.
 
+        The pandas frame is derived from the cached Polars frame via Arrow.
+
+        Parameters
+        ----------
+        zero_copy : bool, optional
+            Back the pandas columns with PyArrow extension arrays, sharing memory with the
+            cached Polars frame instead of copying it into NumPy arrays.
+
         Returns
         -------
         pandas.DataFrame
@@ -625,23 +888,29 @@ class ResultSet(Iterator[Result]):
         True
         """
         try:
-            return self.to_polars().to_pandas()
+            return self.to_polars().to_pandas(use_pyarrow_extension_array=zero_copy)
         except Exception as e:
             raise RuntimeError(f"Failed to convert search results to Pandas DataFrame: {e}") from e
 
-    def write_json(self, file_path: str | None = None) -> str | bytes:
+    def write_json(self, file_path: str | os.PathLike | BinaryIO | None = None) -> str | os.PathLike | BinaryIO:
         """
         Serialize the search results to a JSON string and optionally write to disk.
 
+        When writing, each result is encoded straight from the dataclass and streamed to the file,
+        so no list of dicts or full JSON document is ever held in memory.
+
         Parameters
         ----------
-        file_path : str or None, optional
-            Path to save the JSON file. If None, the JSON string is returned.
+        file_path : str, path-like, binary file object or None, optional
+            Path to save the JSON file, or a file object opened in binary mode to write to.
+            If None, the JSON string is returned.
 
         Returns
         -------
-        str
-            The JSON string if `file_path` is None, otherwise the JSON string that was written to file.
+        str, path-like or binary file object
+            The JSON string if `file_path` is None; otherwise `file_path` itself, unchanged (the same
+            str or path-like object, or the file object written to, left open).
+
         Raises
         -------
         RuntimeError
@@ -662,19 +931,19 @@ class ResultSet(Iterator[Result]):
         >>> path = search_results.write_json(file_path="results.json")
         >>> path.endswith(".json")
         True
+        >>> import io
+        >>> buf = io.BytesIO()
+        >>> search_results.write_json(buf) is buf
+        True
+        >>> buf.getvalue().decode() == json_str
+        True
         """
-        try:
-            json_bytes = json_dumps(self.to_dicts())
-            if file_path:
-                try:
-                    with open(file_path, "w") as f:
-                        f.write(json_bytes)
-                    return file_path
-                except Exception as e:
-                    raise RuntimeError(f"Failed to write JSON to '{file_path}': {e}") from e
-            return json_bytes
-        except Exception as e:
-            raise RuntimeError(f"Failed to serialize results to JSON: {e}") from e
+        if file_path is None:
+            try:
+                return json_dumps(self.results)
+            except Exception as e:
+                raise RuntimeError(f"Failed to serialize results to JSON: {e}") from e
+        return self._stream_to(file_path, b"[", b",", b"]", "JSON")
 
     def to_dicts(self) -> list[dict]:
         """
@@ -754,22 +1023,25 @@ class ResultSet(Iterator[Result]):
         except Exception as e:
             raise RuntimeError(f"Failed to convert results to dict: {e}") from e
 
-    def write_ndjson(self, file_path: str | None = None) -> str:
+    def write_ndjson(self, file_path: str | os.PathLike | BinaryIO | None = None) -> str | os.PathLike | BinaryIO:
         """
         Serialize search results to newline-delimited JSON (NDJSON) format.
 
         Each search result is serialized as a single JSON object per line.
-        The resulting NDJSON string can be written to disk or returned as a string.
+        The resulting NDJSON string can be written to disk or returned as a string; when writing, lines
+        are streamed to the file one result at a time.
 
         Parameters
         ----------
-        file_path : str or None, optional
-            Path to save the NDJSON file. If None, returns the NDJSON string.
+        file_path : str, path-like, binary file object or None, optional
+            Path to save the NDJSON file, or a file object opened in binary mode to write to.
+            If None, returns the NDJSON string.
 
         Returns
         -------
-        str
-            File path if written to file, otherwise the NDJSON string.
+        str, path-like or binary file object
+            The NDJSON string if `file_path` is None; otherwise `file_path` itself, unchanged (the
+            same str or path-like object, or the file object written to, left open).
 
         Raises
         ------
@@ -792,22 +1064,63 @@ class ResultSet(Iterator[Result]):
         >>> path.endswith(".ndjson")
         True
         """
+        if file_path is None:
+            ndjson_lines = []
+            for result in self.results:
+                try:
+                    ndjson_lines.append(json_dumps_bytes(result))
+                except Exception as e:
+                    raise RuntimeError(f"Failed to serialize Result to NDJSON: {e}") from e
+            return (b"\n".join(ndjson_lines) + b"\n").decode("utf-8")
+        return self._stream_to(file_path, b"", b"\n", b"\n", "NDJSON")
 
-        ndjson_lines = []
-        for result in self.results:
-            try:
-                ndjson_lines.append(json_dumps(result.to_dict()))
-            except Exception as e:
-                raise RuntimeError(f"Failed to serialize Result to NDJSON: {e}") from e
+    def _stream_to(
+        self, file_path: str | os.PathLike | BinaryIO, start: bytes, sep: bytes, end: bytes, kind: str
+    ) -> str | os.PathLike | BinaryIO:
+        """
+        Write the encoded results to a path or binary file object, one result at a time.
 
-        if file_path:
-            try:
-                with open(file_path, "w", encoding="utf-8") as f:
-                    f.write("\n".join(ndjson_lines) + "\n")
-                return file_path
-            except Exception as e:
-                raise RuntimeError(f"Failed to write NDJSON to '{file_path}': {e}") from e
-        return "\n".join(ndjson_lines) + "\n"
+        Parameters
+        ----------
+        file_path : str, path-like or binary file object
+            Destination.
+        start, sep, end : bytes
+            Written before the first result, between results and after the last one.
+        kind : str
+            Format name used in error messages.
+
+        Returns
+        -------
+        str, path-like or binary file object
+            `file_path`, unchanged.
+
+        Raises
+        ------
+        RuntimeError
+            If a result cannot be serialized or the file cannot be written.
+        """
+
+        def write(f: BinaryIO) -> None:
+            f.write(start)
+            for i, result in enumerate(self.results):
+                try:
+                    data = json_dumps_bytes(result)
+                except Exception as e:
+                    raise RuntimeError(f"Failed to serialize Result to {kind}: {e}") from e
+                f.write(sep + data if i else data)
+            f.write(end)
+
+        try:
+            if hasattr(file_path, "write"):
+                write(file_path)
+            else:
+                with open(file_path, "wb") as f:
+                    write(f)
+        except RuntimeError:
+            raise
+        except Exception as e:
+            raise RuntimeError(f"Failed to write {kind} to '{file_path}': {e}") from e
+        return file_path
 
     def write_parquet(self, file_path: str | None = None) -> str:
         """
@@ -891,6 +1204,72 @@ class ResultSet(Iterator[Result]):
             raise RuntimeError(f"Failed to write Arrow IPC to '{out}': {e}") from e
         return out
 
+    def sql(self, query: str, table_name: str = "results", as_arrow: bool = False) -> ResultSet | pa.Table:
+        """
+        Run a SQL query over the search results using an in-process DuckDB engine.
+
+        The cached Arrow data behind `to_polars` is registered with a DuckDB connection that is
+        reused across calls, so the results are queried in place without being copied.
+
+        Parameters
+        ----------
+        query : str
+            The SQL query to run. The results are exposed as a table called `table_name`.
+        table_name : str, optional
+            Name the results are registered under in the query.
+        as_arrow : bool, optional
+            Return the raw Arrow table instead of a ResultSet. Use this for aggregations whose
+            columns do not map onto Result fields.
+
+        Returns
+        -------
+        ResultSet or pyarrow.Table
+            The query output.
+
+        Raises
+        ------
+        RuntimeError
+            If the query fails.
+
+        Examples
+        --------
+        >>> from nosible import Result, ResultSet
+        >>> results = ResultSet(
+        ...     [
+        ...         Result(url="https://a.com/1", netloc="a.com", similarity=0.9),
+        ...         Result(url="https://a.com/2", netloc="a.com", similarity=0.7),
+        ...         Result(url="https://b.org/1", netloc="b.org", similarity=0.4),
+        ...     ]
+        ... )
+        >>> top = results.sql("SELECT * FROM results WHERE similarity > 0.5 ORDER BY similarity")
+        >>> [r.url for r in top]
+        ['https://a.com/2', 'https://a.com/1']
+        >>> table = results.sql(
+        ...     "SELECT netloc, avg(similarity) AS sim FROM results GROUP BY 1 ORDER BY 1", as_arrow=True
+        ... )
+        >>> table.column("netloc").to_pylist()
+        ['a.com', 'b.org']
+        """
+        import polars as pl
+
+        arrow_table = self.to_polars().to_arrow()
+        # A cursor is a thread-safe handle onto the shared database; registrations stay local to it.
+        cursor = _duckdb_connection().cursor()
+        try:
+            cursor.register(table_name, arrow_table)
+            out = cursor.execute(query).arrow()
+            # Newer DuckDB releases hand back a RecordBatchReader rather than a Table.
+            if hasattr(out, "read_all"):
+                out = out.read_all()
+        except Exception as e:
+            raise RuntimeError(f"Failed to run SQL query over results: {e}") from e
+        finally:
+            cursor.close()
+
+        if as_arrow:
+            return out
+        return ResultSet.from_polars(pl.from_arrow(out))
+
     def write_duckdb(self, file_path: str | None = None, table_name: str = "results") -> str:
         """
         Serialize the search results to a DuckDB database file and table.
@@ -1327,6 +1706,76 @@ class ResultSet(Iterator[Result]):
         except Exception as e:
             raise RuntimeError(f"Failed to create ResultSet from Arrow data in '{file_path}': {e}") from e
 
+    @classmethod
+    def scan(
+        cls,
+        glob_pattern: str | list[str],
+        filters: Filters | None = None,
+        columns: list[str] | None = None,
+        file_format: str | None = None,
+    ) -> LazyResultSet:
+        """
+        Lazily query an archive of ResultSets saved with `write_parquet` or `write_ipc`.
+
+        Every file matching `glob_pattern` is scanned with Polars, and `filters` and `columns` are
+        pushed down into the scan so only the matching rows and requested columns are read.
+        Nothing is loaded until the returned LazyResultSet is collected.
+
+        Parameters
+        ----------
+        glob_pattern : str or list of str
+            Glob pattern (e.g. "archive/**/*.parquet") or explicit list of files.
+        filters : pl.Expr, list of pl.Expr or dict, optional
+            Predicates to apply, or a mapping of column name to a value or collection of values.
+        columns : list of str, optional
+            Result fields to read. Defaults to all columns.
+        file_format : str, optional
+            Either "parquet" or "ipc". Inferred from the file extension when omitted.
+
+        Returns
+        -------
+        LazyResultSet
+            The deferred query.
+
+        Raises
+        ------
+        ValueError
+            If the file format cannot be determined.
+
+        Examples
+        --------
+        >>> from nosible import Result, ResultSet
+        >>> _ = ResultSet([Result(url="https://a.com", netloc="a.com", language="en")]).write_ipc("a.arrow")
+        >>> _ = ResultSet([Result(url="https://b.org", netloc="b.org", language="fr")]).write_ipc("b.arrow")
+        >>> lazy = ResultSet.scan("[ab].arrow", filters={"language": "fr"}, columns=["url", "netloc"])
+        >>> [r.netloc for r in lazy.collect()]
+        ['b.org']
+        """
+        import polars as pl
+
+        if file_format is None:
+            first = glob_pattern if isinstance(glob_pattern, str) else glob_pattern[0]
+            if first.endswith((".parquet", ".pq")):
+                file_format = "parquet"
+            elif first.endswith((".arrow", ".ipc", ".feather")):
+                file_format = "ipc"
+            else:
+                raise ValueError(f"Cannot infer file format from {first!r}; pass file_format='parquet' or 'ipc'.")
+
+        if file_format == "parquet":
+            frame = pl.scan_parquet(glob_pattern)
+        elif file_format == "ipc":
+            frame = pl.scan_ipc(glob_pattern)
+        else:
+            raise ValueError(f"Unsupported file_format {file_format!r}; expected 'parquet' or 'ipc'.")
+
+        lazy = LazyResultSet(frame)
+        if filters is not None:
+            lazy = lazy.filter(filters)
+        if columns is not None:
+            lazy = lazy.select(columns)
+        return lazy
+
     @classmethod
     def read_duckdb(cls, file_path: str) -> ResultSet:
         """
@@ -1458,6 +1907,67 @@ class ResultSet(Iterator[Result]):
                 raise ValueError(f"Error parsing dictionary into Result: {d}\n{e}") from e
         return cls(results)
 
+    @classmethod
+    def from_json(cls, data: bytes | str, limit: int | None = None) -> ResultSet:
+        """
+        Create a ResultSet from a raw search API response body.
+
+        When msgspec is installed (``pip install nosible[msgspec]``) the body is decoded straight into
+        typed records against a fixed schema, skipping the intermediate dicts. Otherwise, or if the
+        body does not match the schema, it falls back to `json_loads` and `from_dicts`.
+
+        Parameters
+        ----------
+        data : bytes or str
+            JSON body of the form ``{"response": [{...}, ...]}``.
+        limit : int, optional
+            Keep at most this many results.
+
+        Returns
+        -------
+        ResultSet
+            The decoded results.
+
+        Raises
+        ------
+        json.JSONDecodeError
+            If the body is not valid JSON (a ValueError).
+
+        Examples
+        --------
+        >>> body = b'{"response": [{"url": "https://a.com", "similarity": 0.9}, {"url": "https://b.com"}]}'
+        >>> rs = ResultSet.from_json(body)
+        >>> [r.url for r in rs], rs[0].similarity
+        (['https://a.com', 'https://b.com'], 0.9)
+        >>> len(ResultSet.from_json(body, limit=1))
+        1
+        """
+        msgspec = _msgspec_decoder()
+        if msgspec is not None:
+            try:
+                records = msgspec.decoder.decode(data).response[:limit]
+            except msgspec.DecodeError:
+                # Unexpected shape or types: let the dict path handle (or report) it.
+                pass
+            else:
+                astuple, unset = msgspec.astuple, msgspec.UNSET
+                results = []
+                for r in records:
+                    # Positional, in `Result` field order; the trailing field is semantics.
+                    result = Result(*astuple(r)[:-1])
+                    if result.similarity is unset:
+                        result.similarity = r.semantics.similarity if r.semantics is not None else None
+                    results.append(result)
+                return cls(results)
+        try:
+            body = json_loads(data)
+        except RuntimeError as e:
+            # Surface the parser's own error (a ValueError), as `httpx.Response.json` did.
+            if isinstance(e.__cause__, ValueError):
+                raise e.__cause__ from None
+            raise
+        return cls.from_dicts(body.get("response", [])[:limit])
+
     @classmethod
     def from_dict(cls, data: dict | list) -> ResultSet:
         """
@@ -1524,5 +2034,4 @@ class ResultSet(Iterator[Result]):
         """
         Explicitly release any held resources.
         """
-        # TODO: cleanup handles, sessions, etc.
-        pass
+        self.invalidate_cache()
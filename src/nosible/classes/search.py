@@ -3,7 +3,7 @@ from __future__ import annotations
 from dataclasses import asdict, dataclass
 from typing import TYPE_CHECKING
 
-from nosible.utils.json_tools import json_dumps, json_loads, print_dict
+from nosible.utils.json_tools import json_dumps_bytes, json_loads, print_dict
 
 if TYPE_CHECKING:
     from nosible.classes.search_set import SearchSet
@@ -320,7 +320,7 @@ class Search:
         Save the current Search instance to a JSON file.
 
         Saves the search parameters to a file in JSON format using the
-        `json_dumps` utility. This allows for easy persistence and later
+        `json_dumps_bytes` utility. This allows for easy persistence and later
         retrieval of search configurations.
 
         Parameters
@@ -338,8 +338,8 @@ class Search:
         ... )
         >>> search.write_json("search.json")
         """
-        data = json_dumps(self.to_dict())
-        with open(path, "w") as f:
+        data = json_dumps_bytes(self)
+        with open(path, "wb") as f:
             f.write(data)
 
     @classmethod
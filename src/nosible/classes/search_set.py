@@ -2,7 +2,7 @@ from collections.abc import Iterator
 from dataclasses import dataclass, field
 
 from nosible.classes.search import Search
-from nosible.utils.json_tools import json_dumps, json_loads
+from nosible.utils.json_tools import json_dumps, json_dumps_bytes, json_loads
 
 
 @dataclass()
@@ -263,15 +263,15 @@ class SearchSet(Iterator[Search]):
         ... )  # The file 'searches.json' will contain both search queries in JSON format.
         """
         try:
-            json_bytes = json_dumps(self.to_dicts())
             if path:
+                json_bytes = json_dumps_bytes(self.searches_list)
                 try:
-                    with open(path, "w") as f:
+                    with open(path, "wb") as f:
                         f.write(json_bytes)
                     return None
                 except Exception as e:
                     raise RuntimeError(f"Failed to write JSON to '{path}': {e}") from e
-            return json_bytes
+            return json_dumps(self.searches_list)
         except Exception as e:
             raise RuntimeError(f"Failed to serialize results to JSON: {e}") from e
 
@@ -157,4 +157,4 @@ class Snippet:
         >>> isinstance(json_str, str)
         True
         """
-        return json_dumps(self.to_dict())
+        return json_dumps(self)
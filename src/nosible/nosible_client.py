@@ -1,35 +1,47 @@
+import contextlib
+import dataclasses
+import functools
 import gzip
-import json
+import hashlib
+import importlib.util
 import logging
 import os
+import queue
 import re
 import sys
-import textwrap
+import threading
 import time
 import types
 from collections.abc import Iterator
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from typing import Optional, Union
 import warnings
 
 import httpx
-from tenacity import (
-    before_sleep_log,
-    retry,
-    retry_if_exception_type,
-    stop_after_attempt,
-    stop_after_delay,
-    wait_exponential,
-)
 
 from nosible.classes.result_set import ResultSet
 from nosible.classes.search import Search
 from nosible.classes.search_set import SearchSet
 from nosible.classes.snippet_set import SnippetSet
 from nosible.classes.web_page import WebPageData
-from nosible.utils.json_tools import json_loads
-from nosible.utils.rate_limiter import PLAN_RATE_LIMITS, RateLimiter, _rate_limited
+from nosible.utils.compression import check_encoding, compress
+from nosible.utils.json_tools import json_dumps_bytes, json_loads
+from nosible.utils.scheduling import PRIORITY_BATCH, PRIORITY_INTERACTIVE, PriorityExecutor
+from nosible.utils.rate_limiter import (
+    ENDPOINT_CONCURRENCY_LIMITS,
+    PLAN_RATE_LIMITS,
+    ConcurrencyLimiter,
+    ConcurrencyLimitError,
+    RateLimiter,
+    RateLimitError,
+    _acquire_all,
+    _rate_limited,
+    check_rate_limit_backend,
+    check_rate_limit_db,
+    parse_retry_after,
+    wait_retry_after,
+)
 
 # Set up a module‐level logger.
 logger = logging.getLogger(__name__)
@@ -37,6 +49,133 @@ logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.DEBUG)
 logging.disable(logging.CRITICAL)
 
+# Bump whenever the expansions prompt changes, so cached expansions from the old prompt are ignored.
+_EXPANSIONS_PROMPT_VERSION = 1
+
+# Pending closes of async LLM clients scheduled by `Nosible.close` on a running event loop.
+_closing_tasks: set = set()
+
+# Resources shared by clients created with `share_resources=True`, by API key and settings.
+_shared_resources: dict = {}
+_shared_resources_lock = threading.Lock()
+
+
+class _ClientResources:
+    """
+    Lazily built HTTP session, thread pools and limiters of one or more clients.
+
+    Parameters
+    ----------
+    key : tuple, optional
+        Registry key when shared between clients; None for a client's private resources.
+    """
+
+    def __init__(self, key: Optional[tuple] = None):
+        self.key = key
+        self.refs = 0
+        self.values: dict = {}
+        # Re-entrant: a builder may read another lazy resource.
+        self.lock = threading.RLock()
+
+
+class _LazyResource:
+    """
+    Client attribute built on first access by the named builder method.
+
+    Shared resources are kept in the client's `_ClientResources`, so clients created with
+    `share_resources=True` build them once between them; the others are built per client.
+    Assigning to the attribute replaces the value for that client only. Reading it after the
+    client is closed raises RuntimeError.
+
+    Parameters
+    ----------
+    builder : str
+        Name of the client method that builds the value.
+    shared : bool
+        Whether the value may be shared between clients.
+    """
+
+    def __init__(self, builder: str, shared: bool = True):
+        self.builder = builder
+        self.shared = shared
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, client, owner: Optional[type] = None):
+        if client is None:
+            return self
+        if client._closed:
+            raise RuntimeError("This Nosible client is closed.")
+        value = client.__dict__.get(self.name)
+        if value is not None:
+            return value
+        if self.shared:
+            resources = client._resources
+            with resources.lock:
+                value = resources.values.get(self.name)
+                if value is None:
+                    value = resources.values[self.name] = getattr(client, self.builder)()
+        else:
+            with client._retry_lock:
+                value = client.__dict__.get(self.name)
+                if value is None:
+                    value = getattr(client, self.builder)()
+        client.__dict__[self.name] = value
+        return value
+
+    def __set__(self, client, value) -> None:
+        client.__dict__[self.name] = value
+
+
+# Columns of the mock 'engine' table that filters built by `_format_sql` are validated against.
+_SQL_COLUMNS = ("loc", "published", "visited", "certain", "netloc", "language", "companies", "doc_hash")
+
+
+@functools.lru_cache(maxsize=1)
+def _sql_mock_table():
+    """
+    Build the empty Polars frame standing in for the 'engine' table, once per process.
+    """
+    import polars as pl  # Lazy import
+
+    return pl.DataFrame({col: [] for col in _SQL_COLUMNS}).lazy()
+
+
+@functools.lru_cache(maxsize=4096)
+def _sql_is_valid(sql: str) -> bool:
+    """
+    Check that a SQL filter executes against the mock schema.
+
+    Parameters
+    ----------
+    sql : str
+        The SQL query string to validate.
+
+    Returns
+    -------
+    bool
+        True if the SQL is valid, False otherwise.
+    """
+    import polars as pl
+
+    # SQL contexts cannot be shared across threads, but registering the cached frame is cheap.
+    try:
+        pl.SQLContext(engine=_sql_mock_table()).execute(sql)
+        return True
+    except Exception:
+        return False
+
+
+# Rate-limit endpoint each API path counts against.
+_ENDPOINT_BY_PATH = {
+    "search": "fast",
+    "fast-search": "fast",
+    "topic-trend": "fast",
+    "bulk-search": "bulk",
+    "scrape-url": "scrape-url",
+}
+
 
 class Nosible:
     """
@@ -110,6 +249,45 @@ class Nosible:
         IAB Tier 4 category for the content.
     instruction : str, optional
         Instruction to use with the search query.
+    cache_expansions : bool
+        Cache generated query expansions on disk so repeated questions skip the LLM call (default
+        is False). The cache is ``expansions.sqlite`` in `$NOSIBLE_CACHE_DIR` or ``~/.cache/nosible``
+        and stores your questions in plain text alongside their expansions; delete the file to clear it.
+    expansions_cache_ttl : float, optional
+        How long cached expansions stay valid, in seconds (default is 7 days). None keeps them forever.
+    llm_concurrency : int
+        Maximum concurrent LLM requests used when pre-warming expansions.
+    rate_limit_backend : {"memory", "sqlite"}
+        Where rate-limit state is kept. Use "sqlite" to share one budget per API key between
+        all processes on a host.
+    rate_limit_db : str, optional
+        SQLite file used by the "sqlite" rate-limit backend (defaults to the nosible cache directory).
+        The path must end in ``.sqlite``. Install ``nosible[sqlite]`` to lock it across processes.
+    rate_limit_timeout : float, optional
+        Maximum seconds a call may wait for the client-side rate limiter. Calls that would wait
+        longer raise TimeoutError immediately instead of blocking. None waits as long as needed.
+    http2 : bool
+        Multiplex requests over HTTP/2 connections. Requires the ``h2`` package (``pip install nosible[http2]``);
+        falls back to HTTP/1.1 with a warning when it is missing.
+    max_connections : int, optional
+        Maximum open connections to the NOSIBLE API (defaults to `concurrency`).
+    max_keepalive_connections : int, optional
+        Maximum idle connections kept alive for reuse (defaults to `max_connections`).
+    keepalive_expiry : float
+        Seconds an idle connection is kept alive.
+    request_compression : {"gzip", "zstd"}, optional
+        Compress request bodies larger than `compression_threshold` bytes (e.g. `scrape_url` HTML).
+        "zstd" requires ``pip install nosible[zstd]`` on Python < 3.14. None sends them uncompressed.
+    compression_threshold : int
+        Smallest request body, in bytes, that is compressed.
+    track_quota : bool
+        Record API usage on disk so `quota_status` and the monthly rate limits survive restarts
+        (default is False). The ledger is ``quota.sqlite`` in `$NOSIBLE_CACHE_DIR` or
+        ``~/.cache/nosible``; it holds call counts per endpoint and hour, keyed by a hash of the API key.
+    share_resources : bool
+        Share the HTTP session, thread pools and rate limiters with every other client in this
+        process created with the same API key, connection and rate-limit settings and
+        `share_resources=True`. Shared resources are released when the last of those clients is closed.
 
     Notes
     -----
@@ -119,6 +297,8 @@ class Nosible:
     - The `sentiment_model` is used for sentiment analysis.
     - The `expansions_model` is used for generating query expansions.
     - The `timeout`, `retries`, and `concurrency` parameters control the behavior of HTTP requests.
+    - The HTTP session, thread pools and rate limiters are created on first use, so constructing a
+      client is cheap.
 
     Examples
     --------
@@ -127,6 +307,16 @@ class Nosible:
     >>> search = nos.fast_search(question="What is Nosible?", n_results=5)  # doctest: +SKIP
     """
 
+    # Built on first use; shared between clients with `share_resources=True`.
+    _session = _LazyResource("_build_session")
+    _executor = _LazyResource("_build_executor")
+    _llm_executor = _LazyResource("_build_llm_executor")
+    _limiters = _LazyResource("_build_limiters")
+    _concurrency_limiters = _LazyResource("_build_concurrency_limiters")
+    # Retry-wrapped methods, built per client on first call.
+    _post = _LazyResource("_build_post", shared=False)
+    _request_expansions = _LazyResource("_build_request_expansions", shared=False)
+
     def __init__(
         self,
         nosible_api_key: Optional[str] = None,
@@ -162,6 +352,20 @@ class Nosible:
         iab_tier_3: str = None,
         iab_tier_4: str = None,
         instruction: str = None,
+        cache_expansions: bool = False,
+        expansions_cache_ttl: Optional[float] = 7 * 24 * 3600,
+        llm_concurrency: int = 4,
+        rate_limit_backend: str = "memory",
+        rate_limit_db: Optional[str] = None,
+        rate_limit_timeout: Optional[float] = None,
+        http2: bool = False,
+        max_connections: Optional[int] = None,
+        max_keepalive_connections: Optional[int] = None,
+        keepalive_expiry: float = 30.0,
+        request_compression: Optional[str] = None,
+        compression_threshold: int = 4096,
+        track_quota: bool = False,
+        share_resources: bool = False,
         *args, **kwargs
     ) -> None:
 
@@ -192,6 +396,15 @@ class Nosible:
         self.openai_base_url = openai_base_url
         self.sentiment_model = sentiment_model
         self.expansions_model = expansions_model
+        # Pooled LLM clients, created on first use.
+        self._llm_client = None
+        self._async_llm_client = None
+        self._llm_lock = threading.Lock()
+        # Expansion cache, opened on first use.
+        self.cache_expansions = cache_expansions
+        self.expansions_cache_ttl = expansions_cache_ttl
+        self._expansions_cache = None
+        self.llm_concurrency = llm_concurrency
         # Network parameters
         self.timeout = timeout
         self.retries = retries
@@ -202,32 +415,58 @@ class Nosible:
         logging.getLogger("httpx").setLevel(logging.WARNING)
         logging.getLogger("httpcore").setLevel(logging.WARNING)
 
-        self._limiters = {
-            endpoint: [RateLimiter(calls, period) for calls, period in buckets]
-            for endpoint, buckets in PLAN_RATE_LIMITS[self._get_user_plan()].items()
-        }
-
-        # Define retry decorator
-        self._post = retry(
-            reraise=True,
-            stop=stop_after_attempt(self.retries) | stop_after_delay(self.timeout),
-            wait=wait_exponential(multiplier=1, min=1, max=20),
-            retry=retry_if_exception_type(httpx.RequestError),
-            before_sleep=before_sleep_log(self.logger, logging.WARNING),
-        )(self._post)
-
-        # Wrap _generate_expansions in the same retry logic
-        self._generate_expansions = retry(
-            reraise=True,
-            stop=stop_after_attempt(self.retries) | stop_after_delay(self.timeout),
-            wait=wait_exponential(multiplier=1, min=1, max=20),
-            retry=retry_if_exception_type(httpx.RequestError),
-            before_sleep=before_sleep_log(self.logger, logging.WARNING),
-        )(self._generate_expansions)
-
-        # Thread pool for parallel searches
-        self._session = httpx.Client(follow_redirects=True)
-        self._executor = ThreadPoolExecutor(max_workers=self.concurrency)
+        # Reject unknown plans up front, even though the limiters are only built on first use.
+        self._get_user_plan()
+        self._key_id = hashlib.sha256(self.nosible_api_key.encode()).hexdigest()[:16]
+        check_rate_limit_backend(rate_limit_backend)
+        check_rate_limit_db(rate_limit_db)
+        self.rate_limit_backend = rate_limit_backend
+        self.rate_limit_db = rate_limit_db
+        self.rate_limit_timeout = rate_limit_timeout
+        # Persistent usage ledger, opened on first use.
+        self.track_quota = track_quota
+        self._quota = None
+        self._quota_lock = threading.Lock()
+
+        # Request body compression
+        if request_compression is not None:
+            check_encoding(request_compression)
+        self.request_compression = request_compression
+        self.compression_threshold = compression_threshold
+
+        # Pooled HTTP session sized for `concurrency`, optionally multiplexed over HTTP/2
+        if http2 and importlib.util.find_spec("h2") is None:
+            warnings.warn("HTTP/2 requires the 'h2' package (pip install nosible[http2]); using HTTP/1.1.")
+            http2 = False
+        self.http2 = http2
+        self.max_connections = max_connections or self.concurrency
+        self.max_keepalive_connections = max_keepalive_connections or self.max_connections
+        self.keepalive_expiry = keepalive_expiry
+
+        # Session, thread pools, limiters and retry wrappers are built on first use (see `_LazyResource`).
+        self._retry_lock = threading.Lock()
+        self._closed = False
+        if share_resources:
+            # Every setting the shared resources are built from.
+            key = (
+                self._key_id,
+                self.concurrency,
+                self.llm_concurrency,
+                self.http2,
+                self.max_connections,
+                self.max_keepalive_connections,
+                self.keepalive_expiry,
+                self.rate_limit_backend,
+                self.rate_limit_db,
+                self.rate_limit_timeout,
+                self.track_quota,
+            )
+            with _shared_resources_lock:
+                resources = _shared_resources.setdefault(key, _ClientResources(key))
+                resources.refs += 1
+        else:
+            resources = _ClientResources()
+        self._resources = resources
 
         # Headers
         self.headers = {"Accept-Encoding": "gzip", "Content-Type": "application/json", "api-key": self.nosible_api_key}
@@ -261,6 +500,142 @@ class Nosible:
         self.iab_tier_4 = iab_tier_4
         self.instruction = instruction
 
+    def _build_session(self) -> httpx.Client:
+        """
+        Pooled HTTP session sized for `concurrency`, optionally multiplexed over HTTP/2.
+        """
+        return httpx.Client(
+            follow_redirects=True,
+            http2=self.http2,
+            limits=httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_keepalive_connections,
+                keepalive_expiry=self.keepalive_expiry,
+            ),
+        )
+
+    def _build_executor(self) -> PriorityExecutor:
+        """
+        Thread pool for parallel searches, serving interactive work before batches.
+        """
+        return PriorityExecutor(max_workers=self.concurrency)
+
+    def _build_llm_executor(self) -> ThreadPoolExecutor:
+        """
+        Separate pool for LLM calls, so they do not hold search workers.
+        """
+        return ThreadPoolExecutor(max_workers=self.llm_concurrency)
+
+    def _build_limiters(self) -> dict:
+        """
+        One limiter per endpoint enforcing all its windows atomically. Shared backends keep one
+        budget per API key and endpoint.
+        """
+        limiters = {}
+        for endpoint, buckets in PLAN_RATE_LIMITS[self._get_user_plan()].items():
+            (calls, period), *windows = sorted(buckets, key=lambda b: b[1])
+            limiter = RateLimiter(
+                calls,
+                period,
+                backend=self.rate_limit_backend,
+                db_path=self.rate_limit_db,
+                name=f"{self._key_id}_{endpoint}",
+                windows=windows,
+            )
+            if self.track_quota:
+                # Restore the monthly budget spent by earlier processes.
+                limiter.preload(self._get_quota_ledger().hourly_usage(endpoint, limiter.windows[-1][1]))
+            limiters[endpoint] = [limiter]
+        return limiters
+
+    def _build_concurrency_limiters(self) -> dict:
+        """
+        Requests in flight per endpoint, adapting to the server's 409s.
+        """
+        return {
+            endpoint: ConcurrencyLimiter(ENDPOINT_CONCURRENCY_LIMITS.get(endpoint, self.concurrency))
+            for endpoint in PLAN_RATE_LIMITS[self._get_user_plan()]
+        }
+
+    def _build_post(self):
+        """
+        Wrap `_post_once` in the retry policy. Throttled (429) requests are retried too, waiting
+        for Retry-After.
+        """
+        # tenacity is imported here rather than at module level to keep `import nosible` fast.
+        from tenacity import (
+            before_sleep_log,
+            retry,
+            retry_if_exception_type,
+            stop_after_attempt,
+            stop_after_delay,
+            wait_exponential,
+        )
+
+        return retry(
+            reraise=True,
+            stop=stop_after_attempt(self.retries) | stop_after_delay(self.timeout),
+            wait=wait_retry_after(wait_exponential(multiplier=1, min=1, max=20)),
+            retry=retry_if_exception_type((httpx.RequestError, RateLimitError)),
+            before_sleep=before_sleep_log(self.logger, logging.WARNING),
+        )(self._post_once)
+
+    def _build_request_expansions(self):
+        """
+        Wrap the expansions LLM call in the same retry logic as `_post`.
+        """
+        from tenacity import (
+            before_sleep_log,
+            retry,
+            retry_if_exception_type,
+            stop_after_attempt,
+            stop_after_delay,
+            wait_exponential,
+        )
+
+        return retry(
+            reraise=True,
+            stop=stop_after_attempt(self.retries) | stop_after_delay(self.timeout),
+            wait=wait_exponential(multiplier=1, min=1, max=20),
+            retry=retry_if_exception_type(httpx.RequestError),
+            before_sleep=before_sleep_log(self.logger, logging.WARNING),
+        )(self._request_expansions_once)
+
+    def _release_resources(self) -> None:
+        """
+        Drop this client's handle on its session, thread pools and limiters, shutting them down
+        unless another client still shares them. The client cannot be used afterwards.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        resources = self._resources
+        for name, attr in vars(Nosible).items():
+            if isinstance(attr, _LazyResource):
+                self.__dict__.pop(name, None)
+        if resources.key is not None:
+            with _shared_resources_lock:
+                resources.refs -= 1
+                if resources.refs > 0:
+                    return
+                if _shared_resources.get(resources.key) is resources:
+                    del _shared_resources[resources.key]
+        with resources.lock:
+            values, resources.values = resources.values, {}
+        # Shut down HTTP session
+        try:
+            if "_session" in values:
+                values["_session"].close()
+        except Exception:
+            pass
+        # Shut down thread pools; wait = True ensures all submitted tasks complete or are cancelled
+        for name in ("_executor", "_llm_executor"):
+            try:
+                if name in values:
+                    values[name].shutdown(wait=True)
+            except Exception:
+                pass
+
     @_rate_limited("fast")
     def search(
         self,
@@ -299,8 +674,7 @@ class Nosible:
 
         resp = self._post(url="https://www.nosible.ai/search/v2/search", payload=payload)
         resp.raise_for_status()
-        items = resp.json().get("response", [])
-        return ResultSet.from_dicts(items)
+        return ResultSet.from_json(resp.content)
 
     def fast_search(
         self,
@@ -341,6 +715,7 @@ class Nosible:
         iab_tier_3: str = None,
         iab_tier_4: str = None,
         instruction: str = None,
+        priority: int = PRIORITY_INTERACTIVE,
         *args, **kwargs
     ) -> ResultSet:
         """
@@ -425,6 +800,9 @@ class Nosible:
             IAB Tier 4 category for the content.
         instruction : str, optional
             Instruction to use with the search query.
+        priority : int, optional
+            Scheduling priority; lower numbers are served first by the search pool and the rate
+            limiter. Defaults to interactive priority, ahead of `fast_searches` batches.
 
         Returns
         -------
@@ -528,11 +906,11 @@ class Nosible:
             instruction=instruction,
         )
 
-        future = self._executor.submit(self._search_single, search_obj)
+        future = self._executor.submit(self._search_single, search_obj, priority=priority)
         try:
             return future.result()
-        except ValueError:
-            # Propagate our own "too many results" error directly.
+        except (ValueError, TimeoutError):
+            # Propagate our own "too many results" and rate-limit timeout errors directly.
             raise
         except Exception as e:
             self.logger.warning(f"Search for {search_obj.question!r} failed: {e}")
@@ -578,6 +956,7 @@ class Nosible:
         iab_tier_3: str = None,
         iab_tier_4: str = None,
         instruction: str = None,
+        priority: int = PRIORITY_BATCH,
         **kwargs
     ) -> Iterator[ResultSet]:
         """
@@ -609,6 +988,8 @@ class Nosible:
             Any result mentioning these strings will be excluded.
         autogenerate_expansions : bool
             Do you want to generate expansions automatically using a LLM?.
+            Expansions are generated concurrently on a separate LLM pool (see `llm_concurrency`)
+            and each search is dispatched as soon as its expansions are ready.
         publish_start : str, optional
             Start date for when the document was published (ISO format).
         publish_end : str, optional
@@ -660,6 +1041,9 @@ class Nosible:
             IAB Tier 4 category for the content.
         instruction : str, optional
             Instruction to use with the search query.
+        priority : int, optional
+            Scheduling priority; lower numbers are served first by the search pool and the rate
+            limiter. Defaults to batch priority, so interactive `fast_search` calls are not starved.
 
         Returns
         ------
@@ -775,7 +1159,8 @@ class Nosible:
                 instruction=instruction,
             )
 
-            futures = [self._executor.submit(self._search_single, s) for s in searches_list]
+            # Searches needing expansions get them on the LLM pool first, so search workers never wait on the LLM.
+            futures = [self._dispatch_search(s, priority=priority) for s in searches_list]
 
             for future in futures:
                 try:
@@ -786,6 +1171,49 @@ class Nosible:
 
         return _run_generator()
 
+    def _dispatch_search(self, search_obj: Search, priority: int = PRIORITY_BATCH) -> Future:
+        """
+        Submit a search to the search pool, generating its expansions on the LLM pool first if needed.
+
+        When `autogenerate_expansions` is set, the expansions are generated on the LLM thread pool
+        and the search is only handed to the search pool once they are ready, so LLM latency does not
+        hold a search worker or a "fast" rate-limit slot.
+
+        Parameters
+        ----------
+        search_obj : Search
+            The search to run.
+        priority : int
+            Scheduling priority of the search.
+
+        Returns
+        -------
+        concurrent.futures.Future
+            Resolves to the search's ResultSet, or to the exception raised while expanding or searching.
+        """
+        if not search_obj.autogenerate_expansions:
+            return self._executor.submit(self._search_single, search_obj, priority=priority)
+
+        result = Future()
+
+        def _forward(done: Future) -> None:
+            if result.cancelled():
+                return
+            if done.exception() is not None:
+                result.set_exception(done.exception())
+            else:
+                result.set_result(done.result())
+
+        def _on_expanded(done: Future) -> None:
+            try:
+                ready = dataclasses.replace(search_obj, expansions=done.result(), autogenerate_expansions=False)
+                self._executor.submit(self._search_single, ready, priority=priority).add_done_callback(_forward)
+            except Exception as e:
+                if not result.cancelled():
+                    result.set_exception(e)
+
+        self._llm_executor.submit(self._generate_expansions, search_obj.question).add_done_callback(_on_expanded)
+        return result
 
     @_rate_limited("fast")
     def _search_single(self, search_obj: Search) -> ResultSet:
@@ -935,8 +1363,7 @@ class Nosible:
 
         resp = self._post(url="https://www.nosible.ai/search/v2/fast-search", payload=payload)
         resp.raise_for_status()
-        items = resp.json().get("response", [])[:filter_responses]
-        return ResultSet.from_dicts(items)
+        return ResultSet.from_json(resp.content, limit=filter_responses)
 
     @staticmethod
     def _construct_search(
@@ -1318,7 +1745,7 @@ class Nosible:
             except httpx.HTTPStatusError as e:
                 raise ValueError(f"[{question!r}] HTTP {resp.status_code}: {resp.text}") from e
 
-            data = resp.json()
+            data = self._decode_json(resp)
 
             # Bulk search: download & decrypt
             download_from = data.get("download_from")
@@ -1331,8 +1758,7 @@ class Nosible:
                     fernet = Fernet(decrypt_using.encode())
                     decrypted = fernet.decrypt(dl.content)
                     decompressed = gzip.decompress(decrypted)
-                    api_resp = json_loads(decompressed)
-                    return ResultSet.from_dicts(api_resp.get("response", [])[:filter_responses])
+                    return ResultSet.from_json(decompressed, limit=filter_responses)
                 time.sleep(10)
             raise ValueError("Results were not retrieved from Nosible")
         except Exception as e:
@@ -1350,6 +1776,8 @@ class Nosible:
         min_similarity: float = 0.65,
         model: Union[str, None] = "google/gemini-2.0-flash-001",
         show_context: bool = True,
+        max_context_tokens: Optional[int] = None,
+        rerank: bool = False,
     ) -> str:
         """
         RAG-style question answering: retrieve top `n_results` via `.fast_search()`
@@ -1367,6 +1795,12 @@ class Nosible:
             Which LLM to call to answer your question.
         show_context : bool, optional
             Do you want the context to be shown?
+        max_context_tokens : int, optional
+            Approximate token budget for the context. The most relevant documents are kept
+            until the budget is spent. None includes every document in full.
+        rerank : bool, optional
+            Re-rank the documents against `query` with BM25 (see `ResultSet.find_in_search_results`)
+            instead of ordering them by similarity.
 
         Returns
         -------
@@ -1403,41 +1837,207 @@ class Nosible:
         # Retrieve top documents
         results = self.fast_search(question=query, n_results=n_results, min_similarity=min_similarity)
 
-        # Build RAG context
-        context = ""
-        pieces: list[str] = []
-        for idx, result in enumerate(results):
-            pieces.append(f"""
-                Doc {idx + 1}
-                Title: {result.title}
-                Similarity Score: {result.similarity * 100:.2f}%
-                URL: {result.url}
-                Content: {result.content}
-                """)
-            context = "\n".join(pieces)
-
+        prompt, context = self._build_answer_prompt(
+            query=query, results=results, max_context_tokens=max_context_tokens, rerank=rerank
+        )
         if show_context:
-            print(textwrap.dedent(context))
+            print(context)
 
-        # Craft prompt
-        prompt = f"""
-            # TASK DESCRIPTION
+        return self._complete_answer(prompt=prompt, model=model)
 
-            You are a helpful assistant.  Use the following context to answer the question.
-            When you use information from a chunk, cite it by referencing its label in square brackets, e.g. [doc3].
-            
-            ## Question
-            {query}
-            
-            ## Context
-            {context}
-            """
-        from openai import OpenAI
+    def answers(
+        self,
+        queries: list[str],
+        concurrency: Optional[int] = None,
+        n_results: int = 100,
+        min_similarity: float = 0.65,
+        model: Union[str, None] = "google/gemini-2.0-flash-001",
+        max_context_tokens: Optional[int] = None,
+        rerank: bool = False,
+    ) -> Iterator[dict]:
+        """
+        Answer many questions, overlapping retrieval with generation.
+
+        Each question is searched on the search thread pool. As soon as its results arrive, the
+        answer is generated on a bounded LLM pool, so retrieval for later questions runs while the
+        LLM is busy with earlier ones. Answers are yielded in completion order.
 
+        Parameters
+        ----------
+        queries : list of str
+            The questions to answer.
+        concurrency : int, optional
+            Maximum concurrent LLM calls (defaults to `llm_concurrency`).
+        n_results : int
+            How many docs to fetch per question to build the context.
+        min_similarity : float
+            Results must have at least this similarity score.
+        model : str, optional
+            Which LLM to call to answer the questions.
+        max_context_tokens : int, optional
+            Approximate token budget for each context. None includes every document in full.
+        rerank : bool, optional
+            Re-rank the documents against each question with BM25 before applying the budget.
+
+        Returns
+        -------
+        Iterator[dict]
+            One dict per question with keys ``query``, ``answer`` (None on failure), ``error``
+            (the exception raised, or None), ``search_seconds`` and ``llm_seconds``.
+
+        Raises
+        ------
+        ValueError
+            If no API key is configured for the LLM client.
+
+        Examples
+        --------
+        >>> from nosible import Nosible
+        >>> with Nosible() as nos:  # doctest: +SKIP
+        ...     for item in nos.answers(["Who founded DeepMind?", "Who founded OpenAI?"], concurrency=2):
+        ...         print(item["query"], item["search_seconds"], item["llm_seconds"])
+        """
+        if not self.llm_api_key:
+            raise ValueError("An LLM API key is required for answers().")
+        queries = list(queries)
+
+        def _search(query: str) -> tuple:
+            start = time.perf_counter()
+            results = self._search_single(Search(question=query, n_results=n_results, min_similarity=min_similarity))
+            return results, time.perf_counter() - start
+
+        # Function to ensure correct errors are raised.
+        def _run_generator():
+            finished = queue.Queue()
+
+            with ThreadPoolExecutor(max_workers=concurrency or self.llm_concurrency) as llm_pool:
+
+                def _generate(query: str, results: ResultSet, search_seconds: float) -> None:
+                    record = {"query": query, "answer": None, "error": None, "search_seconds": search_seconds}
+                    start = time.perf_counter()
+                    try:
+                        prompt, _ = self._build_answer_prompt(
+                            query=query, results=results, max_context_tokens=max_context_tokens, rerank=rerank
+                        )
+                        record["answer"] = self._complete_answer(prompt=prompt, model=model)
+                    except Exception as e:
+                        record["error"] = e
+                    record["llm_seconds"] = time.perf_counter() - start
+                    finished.put(record)
+
+                def _on_searched(query: str, future: Future) -> None:
+                    try:
+                        results, search_seconds = future.result()
+                        llm_pool.submit(_generate, query, results, search_seconds)
+                    except Exception as e:
+                        self.logger.warning(f"Search for {query!r} failed: {e}")
+                        finished.put(
+                            {"query": query, "answer": None, "error": e, "search_seconds": None, "llm_seconds": None}
+                        )
+
+                for query in queries:
+                    future = self._executor.submit(_search, query, priority=PRIORITY_BATCH)
+                    future.add_done_callback(lambda f, q=query: _on_searched(q, f))
+
+                for _ in queries:
+                    yield finished.get()
+
+        return _run_generator()
+
+    def answer_stream(
+        self,
+        query: str,
+        n_results: int = 100,
+        min_similarity: float = 0.65,
+        model: Union[str, None] = "google/gemini-2.0-flash-001",
+        max_context_tokens: Optional[int] = None,
+        rerank: bool = False,
+    ) -> Iterator[str]:
+        """
+        Like `answer`, but yield the answer text as the LLM streams it back.
+
+        Parameters
+        ----------
+        query : str
+            The user’s natural-language question.
+        n_results : int
+            How many docs to fetch to build the context.
+        min_similarity : float
+            Results must have at least this similarity score.
+        model : str, optional
+            Which LLM to call to answer your question.
+        max_context_tokens : int, optional
+            Approximate token budget for the context. The most relevant documents are kept
+            until the budget is spent. None includes every document in full.
+        rerank : bool, optional
+            Re-rank the documents against `query` with BM25 before applying the budget.
+
+        Returns
+        -------
+        Iterator[str]
+            Chunks of the generated answer, in order.
+
+        Raises
+        ------
+        ValueError
+            If no API key is configured for the LLM client.
+        RuntimeError
+            If the LLM call fails.
+
+        Examples
+        --------
+        >>> from nosible import Nosible
+        >>> with Nosible() as nos:  # doctest: +SKIP
+        ...     for token in nos.answer_stream(query="Who founded DeepMind?", max_context_tokens=4000):
+        ...         print(token, end="", flush=True)
+        """
+        if not self.llm_api_key:
+            raise ValueError("An LLM API key is required for answer_stream().")
+
+        # Function to ensure correct errors are raised.
+        def _run_generator():
+            results = self.fast_search(question=query, n_results=n_results, min_similarity=min_similarity)
+            prompt, _ = self._build_answer_prompt(
+                query=query, results=results, max_context_tokens=max_context_tokens, rerank=rerank
+            )
+            try:
+                stream = self.llm_client.chat.completions.create(
+                    model=model, messages=[{"role": "user", "content": prompt}], stream=True
+                )
+                for chunk in stream:
+                    if chunk.choices and chunk.choices[0].delta.content:
+                        yield chunk.choices[0].delta.content
+            except Exception as e:
+                raise RuntimeError(f"LLM API error: {e}") from e
+
+        return _run_generator()
+
+    def _complete_answer(self, prompt: str, model: str) -> str:
+        """
+        Send a RAG prompt to the LLM and return the formatted answer.
+
+        Parameters
+        ----------
+        prompt : str
+            The prompt built by `_build_answer_prompt`.
+        model : str
+            Which LLM to call.
+
+        Returns
+        -------
+        str
+            The generated answer, prefixed with "Answer:".
+
+        Raises
+        ------
+        RuntimeError
+            If the LLM call fails or returns an invalid response.
+        """
         # Call LLM
-        client = OpenAI(base_url=self.openai_base_url, api_key=self.llm_api_key)
         try:
-            response = client.chat.completions.create(model=model, messages=[{"role": "user", "content": prompt}])
+            response = self.llm_client.chat.completions.create(
+                model=model, messages=[{"role": "user", "content": prompt}]
+            )
         except Exception as e:
             raise RuntimeError(f"LLM API error: {e}") from e
 
@@ -1449,6 +2049,84 @@ class Nosible:
         # Return the generated text
         return "Answer:\n" + response.choices[0].message.content.strip()
 
+    def _build_answer_prompt(
+        self, query: str, results: ResultSet, max_context_tokens: Optional[int] = None, rerank: bool = False
+    ) -> tuple[str, str]:
+        """
+        Build the RAG prompt for `answer` and `answer_stream`.
+
+        Documents are ordered by similarity (or by BM25 relevance when `rerank` is set) and added
+        until roughly `max_context_tokens` tokens (estimated at 4 characters per token) are used;
+        the document that crosses the budget is truncated.
+
+        Parameters
+        ----------
+        query : str
+            The user’s question.
+        results : ResultSet
+            The retrieved documents.
+        max_context_tokens : int, optional
+            Approximate token budget for the context. None means no limit.
+        rerank : bool
+            Re-rank the documents against `query` with BM25.
+
+        Returns
+        -------
+        tuple of str
+            The prompt and the context it contains.
+
+        Examples
+        --------
+        >>> from nosible import Nosible, Result, ResultSet
+        >>> nos = Nosible(nosible_api_key="test|xyz")
+        >>> docs = ResultSet([
+        ...     Result(title="Low", similarity=0.1, content="x" * 400),
+        ...     Result(title="High", similarity=0.9, content="y" * 400),
+        ... ])
+        >>> _, context = nos._build_answer_prompt("q", docs, max_context_tokens=150)
+        >>> context.splitlines()[1:3]
+        ['Doc 1', 'Title: High']
+        >>> "Title: Low" in context, len(context) <= 600
+        (True, True)
+        """
+        ordered = list(results)
+        if rerank and ordered:
+            try:
+                ordered = list(results.find_in_search_results(query, top_k=len(ordered)))
+            except Exception as e:
+                self.logger.warning(f"Re-ranking failed, using similarity order: {e}")
+                ordered = sorted(ordered, key=lambda r: r.similarity or 0.0, reverse=True)
+        else:
+            ordered = sorted(ordered, key=lambda r: r.similarity or 0.0, reverse=True)
+
+        budget = max_context_tokens * 4 if max_context_tokens is not None else None
+        pieces: list[str] = []
+        used = 0
+        for idx, result in enumerate(ordered):
+            similarity = (result.similarity or 0.0) * 100
+            piece = (
+                f"\nDoc {idx + 1}\nTitle: {result.title}\nSimilarity Score: {similarity:.2f}%\n"
+                f"URL: {result.url}\nContent: {result.content}\n"
+            )
+            if budget is not None and used + len(piece) > budget:
+                remaining = budget - used
+                # Only keep a truncated document if some of its content still fits.
+                if remaining > len(piece) - len(result.content or ""):
+                    pieces.append(piece[:remaining])
+                break
+            pieces.append(piece)
+            used += len(piece) + 1
+        context = "\n".join(pieces)
+
+        prompt = (
+            "# TASK DESCRIPTION\n\n"
+            "You are a helpful assistant.  Use the following context to answer the question.\n"
+            "When you use information from a chunk, cite it by referencing its label in square brackets, e.g. [doc3].\n\n"
+            f"## Question\n{query}\n\n"
+            f"## Context\n{context}\n"
+        )
+        return prompt, context
+
     @_rate_limited("scrape-url")
     def scrape_url(self, html: str = "", recrawl: bool = False, render: bool = False, url: str = None) -> WebPageData:
         """
@@ -1508,7 +2186,7 @@ class Nosible:
             payload={"html": html, "recrawl": recrawl, "render": render, "url": url},
         )
         try:
-            data = response.json()
+            data = self._decode_json(response)
         except Exception as e:
             self.logger.error(f"Failed to parse JSON from response: {e}")
             raise ValueError("Invalid JSON response from server") from e
@@ -1586,7 +2264,7 @@ class Nosible:
         response = self._post(url="https://www.nosible.ai/search/v2/topic-trend", payload=payload)
         # Will raise ValueError on rate-limit or auth errors
         response.raise_for_status()
-        payload = response.json().get("response", {})
+        payload = self._decode_json(response).get("response", {})
 
         # if no window requested, return everything
         if start_date is None and end_date is None:
@@ -1604,11 +2282,115 @@ class Nosible:
         return filtered
 
 
+    @property
+    def llm_client(self):
+        """
+        Shared OpenAI-compatible client for `openai_base_url`.
+
+        The client is created on first use and reused by `answer`, query expansions and
+        sentiment scoring, so its HTTP connection pool and TLS sessions survive between calls.
+        It is safe to use from multiple threads.
+
+        Returns
+        -------
+        openai.OpenAI
+            The pooled LLM client.
+
+        Raises
+        ------
+        ValueError
+            If no LLM API key is configured.
+
+        Examples
+        --------
+        >>> from nosible import Nosible
+        >>> nos = Nosible(nosible_api_key="test|xyz", llm_api_key="sk-test")
+        >>> nos.llm_client is nos.llm_client
+        True
+        """
+        if self._llm_client is None:
+            with self._llm_lock:
+                if self._llm_client is None:
+                    if not self.llm_api_key:
+                        raise ValueError("An LLM API key is required to create an LLM client.")
+                    from openai import OpenAI
+
+                    self._llm_client = OpenAI(base_url=self.openai_base_url, api_key=self.llm_api_key)
+        return self._llm_client
+
+    @property
+    def async_llm_client(self):
+        """
+        Shared asyncio OpenAI-compatible client for `openai_base_url`.
+
+        Like `llm_client`, it is created on first use and then reused. Use it from a single
+        event loop, as its connection pool is bound to the loop it first runs on.
+
+        Returns
+        -------
+        openai.AsyncOpenAI
+            The pooled async LLM client.
+
+        Raises
+        ------
+        ValueError
+            If no LLM API key is configured.
+        """
+        if self._async_llm_client is None:
+            with self._llm_lock:
+                if self._async_llm_client is None:
+                    if not self.llm_api_key:
+                        raise ValueError("An LLM API key is required to create an LLM client.")
+                    from openai import AsyncOpenAI
+
+                    self._async_llm_client = AsyncOpenAI(base_url=self.openai_base_url, api_key=self.llm_api_key)
+        return self._async_llm_client
+
+    def prewarm(self, connections: int = 1) -> int:
+        """
+        Open connections to the NOSIBLE API ahead of time.
+
+        Performs DNS lookup and TLS handshakes for `connections` pooled connections in parallel, so
+        the first searches do not pay for them. One connection is enough with `http2=True`.
+
+        Parameters
+        ----------
+        connections : int
+            Number of connections to open.
+
+        Returns
+        -------
+        int
+            Number of connections opened successfully.
+
+        Examples
+        --------
+        >>> from nosible import Nosible
+        >>> with Nosible(concurrency=20) as nos:  # doctest: +SKIP
+        ...     nos.prewarm(connections=20)
+        20
+        """
+
+        def _touch(_) -> bool:
+            try:
+                self._session.head("https://www.nosible.ai/", timeout=self.timeout)
+                return True
+            except httpx.HTTPError as e:
+                self.logger.warning(f"Connection prewarm failed: {e}")
+                return False
+
+        with ThreadPoolExecutor(max_workers=max(connections, 1)) as pool:
+            return sum(pool.map(_touch, range(connections)))
+
     def close(self):
         """
         Close the Nosible client, shutting down the HTTP session
         and thread pool to release network and threading resources.
 
+        The pooled async LLM client is closed too: on the running event loop when called from
+        async code (the close is scheduled, not awaited), otherwise in a temporary loop. From async
+        code prefer `aclose`, which awaits it. API calls on a closed client raise RuntimeError.
+
         Examples
         --------
         >>> from nosible import Nosible
@@ -1621,21 +2403,156 @@ class Nosible:
         >>> print("No Error")
         No Error
         """
-        # Shut down HTTP session
+        # Release the HTTP session, thread pools and limiters (if not shared with another client)
+        self._release_resources()
+        # Shut down pooled LLM clients
+        try:
+            if self._llm_client is not None:
+                self._llm_client.close()
+        except Exception:
+            pass
+        self._llm_client = None
+        async_llm_client, self._async_llm_client = self._async_llm_client, None
+        if async_llm_client is not None:
+            self._close_async_llm_client(async_llm_client)
+        # Close the expansion cache
         try:
-            self._session.close()
+            if self._expansions_cache is not None:
+                self._expansions_cache.close()
         except Exception:
             pass
-        # Shut down thread pool
+        self._expansions_cache = None
+        # Flush recorded usage to disk
+        try:
+            if self._quota is not None:
+                self._quota.close()
+        except Exception:
+            pass
+        self._quota = None
+
+    @staticmethod
+    def _close_async_llm_client(client) -> None:
+        """
+        Close an `AsyncOpenAI` client from synchronous code.
+
+        Parameters
+        ----------
+        client : openai.AsyncOpenAI
+            The client to close.
+        """
+        import asyncio
+
         try:
-            # wait = True ensures all submitted tasks complete or are cancelled
-            self._executor.shutdown(wait=True)
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        try:
+            if loop is not None:
+                # Keep a reference until the close finishes, or the task may be garbage-collected.
+                task = loop.create_task(client.close())
+                _closing_tasks.add(task)
+                task.add_done_callback(_closing_tasks.discard)
+            else:
+                asyncio.run(client.close())
         except Exception:
             pass
 
-    def _post(self, url: str, payload: dict, headers: dict = None, timeout: int = None) -> httpx.Response:
+    async def aclose(self) -> None:
+        """
+        Close the Nosible client from async code, awaiting the pooled async LLM client.
+
+        Examples
+        --------
+        >>> import asyncio
+        >>> from nosible import Nosible
+        >>> asyncio.run(Nosible().aclose())
+        """
+        async_llm_client, self._async_llm_client = self._async_llm_client, None
+        if async_llm_client is not None:
+            try:
+                await async_llm_client.close()
+            except Exception:
+                pass
+        self.close()
+
+    async def __aenter__(self) -> "Nosible":
         """
-        Internal helper to send a POST request with retry logic.
+        Enter the async context manager, returning this client instance.
+
+        Returns
+        -------
+        Nosible
+            The current client instance.
+        """
+        return self
+
+    async def __aexit__(
+        self,
+        _exc_type: Optional[type[BaseException]],
+        _exc_val: Optional[BaseException],
+        _exc_tb: Optional[types.TracebackType],
+    ) -> Optional[bool]:
+        """
+        Close the client with `aclose`, letting exceptions propagate.
+        """
+        await self.aclose()
+        return False
+
+    def prewarm_expansions(self, searches: Union[SearchSet, list[Search], list[str]]) -> dict:
+        """
+        Generate query expansions for many questions concurrently.
+
+        Distinct questions are expanded in parallel on the LLM thread pool (`llm_concurrency`
+        workers). With `cache_expansions` enabled the expansions are stored in the expansion
+        cache, so searches using `autogenerate_expansions=True` afterwards do not wait on the LLM.
+        Questions that fail to expand are logged and left out of the result.
+
+        Parameters
+        ----------
+        searches : SearchSet, list of Search or list of str
+            The searches, or plain questions, to expand.
+
+        Returns
+        -------
+        dict
+            Mapping of each successfully expanded question to its list of expansions.
+
+        Raises
+        ------
+        ValueError
+            If no LLM API key is set.
+
+        Examples
+        --------
+        >>> from nosible import Nosible
+        >>> nos = Nosible(llm_api_key=None)
+        >>> nos.llm_api_key = None
+        >>> nos.prewarm_expansions(["What is Nosible?"])  # doctest: +ELLIPSIS
+        Traceback (most recent call last):
+        ...
+        ValueError: LLM API key is required for generating expansions.
+        """
+        if not self.llm_api_key:
+            raise ValueError("LLM API key is required for generating expansions.")
+
+        questions = []
+        for s in searches:
+            question = s.question if isinstance(s, Search) else s
+            if question and question not in questions:
+                questions.append(question)
+
+        futures = {q: self._llm_executor.submit(self._generate_expansions, q) for q in questions}
+        expanded = {}
+        for question, future in futures.items():
+            try:
+                expanded[question] = future.result()
+            except Exception as e:
+                self.logger.warning(f"Expansions for {question!r} failed: {e}")
+        return expanded
+
+    def _post_once(self, url: str, payload: dict, headers: dict = None, timeout: int = None) -> httpx.Response:
+        """
+        Internal helper to send a POST request; `_post` wraps it with retry logic.
 
         Parameters
         ----------
@@ -1652,10 +2569,10 @@ class Nosible:
         ------
         ValueError
             If the user API key is invalid.
-        ValueError
-            If the user hits their rate limit.
-        ValueError
-            If the user is making too many concurrent searches.
+        RateLimitError
+            If the user hits their rate limit (a ValueError, retried automatically).
+        ConcurrencyLimitError
+            If the server keeps rejecting requests as too concurrent (a ValueError).
         ValueError
             If an unexpected error occurs.
         ValueError
@@ -1668,13 +2585,37 @@ class Nosible:
         httpx.Response
             The HTTP response object.
         """
-        response = self._session.post(
-            url=url,
-            json=payload,
-            headers=headers if headers is not None else self.headers,
-            timeout=timeout if timeout is not None else self.timeout,
-            follow_redirects=True,
-        )
+        # Serialize once with orjson, compressing large bodies if enabled.
+        body = json_dumps_bytes(payload)
+        headers = dict(headers if headers is not None else self.headers)
+        if self.request_compression is not None and len(body) >= self.compression_threshold:
+            body = compress(body, self.request_compression)
+            headers["Content-Encoding"] = self.request_compression
+
+        endpoint = _ENDPOINT_BY_PATH.get(url.rstrip("/").rsplit("/", 1)[-1])
+        concurrency = self._concurrency_limiters.get(endpoint)
+        attempt = 0
+        while True:
+            if attempt:
+                # Each resend is a new call against the rate limits; the first was paid for by the caller.
+                _acquire_all(self._limiters[endpoint], self.rate_limit_timeout)
+            with concurrency.slot(timeout=self.rate_limit_timeout) if concurrency else contextlib.nullcontext():
+                response = self._session.post(
+                    url=url,
+                    content=body,
+                    headers=headers,
+                    timeout=timeout if timeout is not None else self.timeout,
+                    follow_redirects=True,
+                )
+                if response.status_code != 409 or concurrency is None:
+                    break
+                # Too many requests in flight: lower our cap before giving the slot back.
+                concurrency.reject()
+            attempt += 1
+            if attempt >= self.retries:
+                raise ConcurrencyLimitError("Too many concurrent searches.")
+            # Retry once another request has finished (or after a backoff, if the load is elsewhere).
+            concurrency.wait_for_release(timeout=min(2**attempt, 20))
 
         # If unauthorized, or if the payload is string too short, treat as invalid API key
         if response.status_code == 401:
@@ -1682,7 +2623,7 @@ class Nosible:
         if response.status_code == 422:
             content_type = response.headers.get("Content-Type", "")
             if content_type.startswith("application/json"):
-                body = response.json()
+                body = self._decode_json(response)
                 if isinstance(body, list):
                     body = body[0]
                 print(body)
@@ -1690,10 +2631,15 @@ class Nosible:
                     raise ValueError("Your API key is not valid: Too Short.")
             else:
                 raise ValueError("You made a bad request.")
+        # Feed the server's view of our rate limit back into the matching limiter.
+        limiter = self._adaptive_limiter(url)
         if response.status_code == 429:
-            raise ValueError("You have hit your rate limit.")
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if limiter is not None:
+                limiter.penalize(retry_after)
+            raise RateLimitError("You have hit your rate limit.", retry_after=retry_after)
         if response.status_code == 409:
-            raise ValueError("Too many concurrent searches.")
+            raise ConcurrencyLimitError("Too many concurrent searches.")
         if response.status_code == 500:
             raise ValueError("An unexpected error occurred.")
         if response.status_code == 502:
@@ -1701,8 +2647,130 @@ class Nosible:
         if response.status_code == 504:
             raise ValueError("NOSIBLE is currently overloaded.")
 
+        if concurrency is not None and response.is_success:
+            concurrency.accept()
+        if limiter is not None and response.is_success:
+            limiter.reward()
+            limiter.observe(response.headers)
+        if self.track_quota and endpoint is not None and response.is_success:
+            self._get_quota_ledger().record(endpoint)
         return response
 
+    def _get_quota_ledger(self):
+        """
+        Return the persistent usage ledger, opening it on first use.
+
+        Returns
+        -------
+        QuotaLedger
+            The ledger for this API key.
+        """
+        if self._quota is None:
+            with self._quota_lock:
+                if self._quota is None:
+                    from nosible.utils.disk_cache import default_cache_dir
+                    from nosible.utils.quota import QuotaLedger
+
+                    self._quota = QuotaLedger(os.path.join(default_cache_dir(), "quota.sqlite"), key_id=self._key_id)
+        return self._quota
+
+    def quota_status(self) -> dict:
+        """
+        Report quota usage for each endpoint of your plan.
+
+        Usage is read from the on-disk ledger, so it includes calls made by earlier runs and by
+        other processes on this host using the same API key. The projected exhaustion time assumes
+        the average rate of the last 24 hours continues.
+
+        Returns
+        -------
+        dict
+            Mapping of endpoint ("fast", "bulk", "scrape-url") to a dict with ``limit``,
+            ``window_s``, ``used``, ``remaining``, ``calls_per_hour`` and ``projected_exhaustion``
+            (a UTC datetime, or None when there has been no recent usage).
+
+        Raises
+        ------
+        ValueError
+            If quota tracking is disabled.
+
+        Examples
+        --------
+        >>> from nosible import Nosible
+        >>> nos = Nosible(nosible_api_key="test|xyz", track_quota=True)
+        >>> status = nos.quota_status()  # doctest: +SKIP
+        >>> status["fast"]["limit"]  # doctest: +SKIP
+        3000
+        """
+        if not self.track_quota:
+            raise ValueError("Quota tracking is disabled; create the client with track_quota=True.")
+        return self._get_quota_ledger().status(PLAN_RATE_LIMITS[self._get_user_plan()])
+
+    @staticmethod
+    def _decode_json(response: httpx.Response):
+        """
+        Decode a JSON response body with the fastest available parser.
+
+        Parses the raw (already decompressed) body bytes with `json_loads` instead of
+        `httpx.Response.json`, which decodes to text first. `json_loads` uses orjson from the
+        optional ``nosible[orjson]`` extra when it is installed, and the stdlib otherwise.
+
+        Parameters
+        ----------
+        response : httpx.Response
+            The response to decode.
+
+        Returns
+        -------
+        dict or list
+            The decoded body.
+
+        Raises
+        ------
+        json.JSONDecodeError
+            If the body is not valid JSON (a ValueError, as raised by `httpx.Response.json`).
+
+        Examples
+        --------
+        >>> import httpx
+        >>> Nosible._decode_json(httpx.Response(200, json={"response": [{"url": "https://a.com"}]}))
+        {'response': [{'url': 'https://a.com'}]}
+        >>> try:
+        ...     Nosible._decode_json(httpx.Response(200, content=b"<html>"))
+        ... except ValueError as e:
+        ...     type(e).__name__
+        'JSONDecodeError'
+        """
+        try:
+            return json_loads(response.content)
+        except RuntimeError as e:
+            # Surface the parser's own error (json.JSONDecodeError, or UnicodeDecodeError), as before.
+            if isinstance(e.__cause__, ValueError):
+                raise e.__cause__ from None
+            raise
+
+    def _adaptive_limiter(self, url: str) -> Optional[RateLimiter]:
+        """
+        Find the limiter that should learn from responses to `url`.
+
+        Server feedback tunes the call spacing of the endpoint's shortest window (e.g. per minute).
+
+        Parameters
+        ----------
+        url : str
+            The API URL that was called.
+
+        Returns
+        -------
+        RateLimiter or None
+            The endpoint's limiter, or None for unknown URLs.
+        """
+        endpoint = _ENDPOINT_BY_PATH.get(url.rstrip("/").rsplit("/", 1)[-1])
+        limiters = [rl for rl in self._limiters.get(endpoint, []) if isinstance(rl, RateLimiter)]
+        if not limiters:
+            return None
+        return min(limiters, key=lambda rl: rl.period_s)
+
     def _get_user_plan(self) -> str:
         """
         Determine the user's subscription plan from the API key.
@@ -1739,10 +2807,34 @@ class Nosible:
 
         return prefix
 
+    def _get_expansions_cache(self):
+        """
+        Return the on-disk expansion cache, opening it on first use.
+
+        Returns
+        -------
+        DiskCache or None
+            The cache, or None when `cache_expansions` is disabled.
+        """
+        if not self.cache_expansions:
+            return None
+        if self._expansions_cache is None:
+            with self._llm_lock:
+                if self._expansions_cache is None:
+                    from nosible.utils.disk_cache import DiskCache, default_cache_dir
+
+                    self._expansions_cache = DiskCache(
+                        os.path.join(default_cache_dir(), "expansions.sqlite"), ttl=self.expansions_cache_ttl
+                    )
+        return self._expansions_cache
+
     def _generate_expansions(self, question: Union[str, Search]) -> list:
         """
         Generate up to 10 semantically diverse question expansions using an LLM.
 
+        Expansions are looked up in the expansion cache first, keyed by the question,
+        `expansions_model` and prompt version; fresh ones are stored there.
+
         Parameters
         ----------
         question : str
@@ -1777,6 +2869,39 @@ class Nosible:
         if isinstance(question, Search):
             question = question.question
 
+        cache = self._get_expansions_cache()
+        key = f"{_EXPANSIONS_PROMPT_VERSION}:{self.expansions_model}:{question}"
+        if cache is not None:
+            cached = cache.get(key)
+            if cached is not None:
+                self.logger.debug(f"Cached expansions: {cached}")
+                return cached
+
+        expansions = self._request_expansions(question)
+        if cache is not None:
+            cache.set(key, expansions)
+        return expansions
+
+    def _request_expansions_once(self, question: str) -> list:
+        """
+        Ask the LLM for 10 question expansions, bypassing the expansion cache. `_request_expansions`
+        wraps it with retry logic.
+
+        Parameters
+        ----------
+        question : str
+            Original user query.
+
+        Returns
+        -------
+        list of str
+            The expanded query strings.
+
+        Raises
+        ------
+        RuntimeError
+            If the LLM response is invalid or cannot be parsed.
+        """
         # Build a clear prompt that demands JSON output of exactly 10 strings.
         prompt = f"""
             # TASK DESCRIPTION
@@ -1823,13 +2948,8 @@ class Nosible:
                - Contextual Example: Swap "diabetes treatment" with "insulin therapy" or "blood sugar management".
 
         """.replace("                ", "")
-        # Lazy load
-        from openai import OpenAI
-
-        client = OpenAI(base_url=self.openai_base_url, api_key=self.llm_api_key)
-
         # Call the chat completions endpoint.
-        resp = client.chat.completions.create(
+        resp = self.llm_client.chat.completions.create(
             model=self.expansions_model, messages=[{"role": "user", "content": prompt.strip()}], temperature=0.7
         )
 
@@ -1845,7 +2965,7 @@ class Nosible:
 
         # Parse JSON.
         try:
-            expansions = json.loads(raw)
+            expansions = json_loads(raw)
         except Exception as decode_err:
             raise RuntimeError(f"OpenRouter response was not valid JSON: '{raw}'") from decode_err
 
@@ -1918,6 +3038,9 @@ class Nosible:
         """
         Construct an SQL SELECT statement with WHERE clauses based on provided filters.
 
+        Compilation is memoized on the filter values (see `_compile_sql`), so the searches of a
+        `SearchSet` that share filters pay for it once.
+
         Parameters
         ----------
         publish_start : str, optional
@@ -1953,6 +3076,59 @@ class Nosible:
         ValueError
             If more than 50 items in a filter are given.
         """
+
+        def _key(values):
+            return tuple(values) if values is not None else None
+
+        sql_filter = self._compile_sql(
+            publish_start,
+            publish_end,
+            visited_start,
+            visited_end,
+            certain,
+            _key(include_netlocs),
+            _key(exclude_netlocs),
+            _key(include_companies),
+            _key(exclude_companies),
+            _key(include_docs),
+            _key(exclude_docs),
+        )
+        # Logged here rather than in the cached `_compile_sql`, so every call is logged.
+        self.logger.debug(f"Generated SQL filter: {sql_filter}")
+        return sql_filter
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _compile_sql(
+        publish_start: Optional[str],
+        publish_end: Optional[str],
+        visited_start: Optional[str],
+        visited_end: Optional[str],
+        certain: Optional[bool],
+        include_netlocs: Optional[tuple],
+        exclude_netlocs: Optional[tuple],
+        include_companies: Optional[tuple],
+        exclude_companies: Optional[tuple],
+        include_docs: Optional[tuple],
+        exclude_docs: Optional[tuple],
+    ) -> str:
+        """
+        Compile and validate the SQL filter for `_format_sql`, memoized on its (hashable) arguments.
+
+        Kept free of side effects such as logging, so a cached result behaves like a fresh one.
+
+        Invalid filters raise every time; only successful compilations are cached.
+
+        Returns
+        -------
+        str
+            An SQL query string with appropriate WHERE clauses.
+
+        Raises
+        ------
+        ValueError
+            If a date is malformed, a filter has more than 50 items, or the SQL is invalid.
+        """
         for name, value in [
             ("publish_start", publish_start),
             ("publish_end", publish_end),
@@ -1960,7 +3136,7 @@ class Nosible:
             ("visited_end", visited_end),
         ]:
             if value is not None:
-                self._validate_date_format(string=value, name=name)
+                Nosible._validate_date_format(string=value, name=name)
 
         # Validate list lengths
         for name, value in [
@@ -2054,11 +3230,9 @@ class Nosible:
         sql_filter = " ".join(sql)
 
         # Validate the SQL query against the schemas
-        if not self._validate_sql(sql_filter):
+        if not _sql_is_valid(sql_filter):
             raise ValueError(f"Invalid SQL query: {sql_filter!r}. Please check your filters and try again.")
 
-        self.logger.debug(f"Generated SQL filter: {sql_filter}")
-
         # Return the final SQL filter string
         return sql_filter
 
@@ -2066,6 +3240,9 @@ class Nosible:
         """
         Validate a SQL query string by attempting to execute it against a mock schema.
 
+        Results are memoized per SQL string and the mock table is built once per process, so
+        repeated filters cost a dictionary lookup.
+
         Parameters
         ----------
         sql : str
@@ -2083,28 +3260,7 @@ class Nosible:
         >>> Nosible()._validate_sql(sql="SELECT * FROM missing_table")
         False
         """
-        # Define a mock schema for the 'engine' table with all possible columns used in _format_sql
-        columns = [
-            "loc",
-            "published",
-            "visited",
-            "certain",
-            "netloc",
-            "language",
-            "companies"
-            "doc_hash",
-        ]
-        import polars as pl  # Lazy import
-
-        # Create a dummy DataFrame with correct columns and no rows
-        df = pl.DataFrame({col: [] for col in columns})
-        ctx = pl.SQLContext()
-        ctx.register("engine", df)
-        try:
-            ctx.execute(sql)
-            return True
-        except Exception:
-            return False
+        return _sql_is_valid(sql)
 
     def __enter__(self) -> "Nosible":
         """
@@ -0,0 +1,156 @@
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+from nosible.utils.json_tools import json_dumps, json_loads
+
+
+def default_cache_dir() -> str:
+    """
+    Return the directory used for on-disk caches.
+
+    Uses `$NOSIBLE_CACHE_DIR` when set, otherwise `~/.cache/nosible`.
+
+    Returns
+    -------
+    str
+        Path to the cache directory (not created by this function).
+
+    Examples
+    --------
+    >>> import os
+    >>> os.environ["NOSIBLE_CACHE_DIR"] = "/tmp/nosible-cache"
+    >>> default_cache_dir()
+    '/tmp/nosible-cache'
+    >>> del os.environ["NOSIBLE_CACHE_DIR"]
+    """
+    return os.getenv("NOSIBLE_CACHE_DIR") or os.path.join(os.path.expanduser("~"), ".cache", "nosible")
+
+
+class DiskCache:
+    """
+    Thread-safe, SQLite-backed key/value cache for JSON-serializable values.
+
+    The cache can be shared by several threads and processes on the same host. Entries
+    older than `ttl` seconds are treated as missing.
+
+    Parameters
+    ----------
+    path : str
+        Path to the SQLite file. Parent directories are created if needed.
+    ttl : float, optional
+        Time-to-live of an entry in seconds. None keeps entries forever.
+
+    Examples
+    --------
+    >>> import tempfile, os
+    >>> cache = DiskCache(os.path.join(tempfile.mkdtemp(), "cache.sqlite"))
+    >>> cache.get("missing") is None
+    True
+    >>> cache.set("a", [1, 2])
+    >>> cache.get("a")
+    [1, 2]
+    >>> cache.set_many({"b": 0.5, "c": "x"})
+    >>> cache.get_many(["a", "b", "missing"])
+    {'a': [1, 2], 'b': 0.5}
+    >>> cache.close()
+    """
+
+    def __init__(self, path: str, ttl: Optional[float] = None):
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._con = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        with self._lock:
+            self._con.execute("PRAGMA journal_mode=WAL")
+            self._con.execute(
+                "CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value TEXT NOT NULL, created REAL NOT NULL)"
+            )
+            self._con.commit()
+
+    def get(self, key: str) -> Optional[object]:
+        """
+        Look up a single entry.
+
+        Parameters
+        ----------
+        key : str
+            The cache key.
+
+        Returns
+        -------
+        object or None
+            The cached value, or None if it is missing or expired.
+        """
+        return self.get_many([key]).get(key)
+
+    def get_many(self, keys: list) -> dict:
+        """
+        Look up several entries at once.
+
+        Parameters
+        ----------
+        keys : list of str
+            The cache keys.
+
+        Returns
+        -------
+        dict
+            Mapping of each found (and unexpired) key to its value.
+        """
+        if not keys:
+            return {}
+        min_created = time.time() - self.ttl if self.ttl is not None else float("-inf")
+        found = {}
+        with self._lock:
+            # Stay well below SQLite's bound-parameter limit.
+            for start in range(0, len(keys), 500):
+                chunk = keys[start : start + 500]
+                rows = self._con.execute(
+                    f"SELECT key, value, created FROM cache WHERE key IN ({', '.join('?' * len(chunk))})", chunk
+                ).fetchall()
+                for key, value, created in rows:
+                    if created >= min_created:
+                        found[key] = json_loads(value)
+        return found
+
+    def set(self, key: str, value: object) -> None:
+        """
+        Store a single entry.
+
+        Parameters
+        ----------
+        key : str
+            The cache key.
+        value : object
+            A JSON-serializable value.
+        """
+        self.set_many({key: value})
+
+    def set_many(self, items: dict) -> None:
+        """
+        Store several entries in one transaction.
+
+        Parameters
+        ----------
+        items : dict
+            Mapping of cache key to JSON-serializable value.
+        """
+        if not items:
+            return
+        now = time.time()
+        rows = [(key, json_dumps(value), now) for key, value in items.items()]
+        with self._lock:
+            self._con.executemany("INSERT OR REPLACE INTO cache (key, value, created) VALUES (?, ?, ?)", rows)
+            self._con.commit()
+
+    def close(self) -> None:
+        """
+        Close the underlying SQLite connection.
+        """
+        with self._lock:
+            self._con.close()
@@ -1,3 +1,4 @@
+import dataclasses
 import json
 from typing import Union
 
@@ -5,28 +6,47 @@ try:
     import orjson
 
     _use_orjson = True
+    # Dataclasses are serialized natively; OPT_NON_STR_KEYS coerces int/float/... dict keys to str.
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
 except ImportError:
     _use_orjson = False
+    _ORJSON_OPTIONS = 0
 
 # --------------------------------------------------------------------------------------------------------------
 # Utility functions for JSON serialization/deserialization
 # --------------------------------------------------------------------------------------------------------------
 
 
+def _json_default(o):
+    """
+    Serialize dataclasses for the standard-library fallback (orjson handles them natively).
+
+    Only the top level is converted; nested dataclasses come back through this hook, so no deep
+    copy is made.
+    """
+    if dataclasses.is_dataclass(o) and not isinstance(o, type):
+        return {f.name: getattr(o, f.name) for f in dataclasses.fields(o)}
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+
 def json_dumps(obj: object) -> str:
     """
-    Returns a JSON byte-string if using orjson, else a unicode str.
+    Serialize an object to a JSON string.
+
+    Uses orjson when installed (``pip install nosible[orjson]``), with non-str dict keys coerced to
+    str and dataclasses (such as `Result`, `Search` and `Snippet`) serialized directly, without an
+    intermediate dict. Falls back to the standard library otherwise. Writers that can take bytes should use `json_dumps_bytes`,
+    which skips the decode.
 
     Parameters
     ----------
     obj : object
-        Object to serialize; must be JSON-serializable.
+        Object to serialize; must be JSON-serializable or a dataclass.
 
     Returns
     -------
-    Union[bytes, str]
-        If `orjson` is available (`_use_orjson` is True), returns a UTF-8 decoded
-        unicode `str`; otherwise, returns a JSON `str` via the standard `json.dumps`.
+    str
+        The encoded JSON.
 
     Raises
     ------
@@ -35,54 +55,66 @@ def json_dumps(obj: object) -> str:
 
     Examples
     --------
-    # Standard dict serialization (no orjson)
-    >>> _use_orjson = False
-    >>> json_dumps({"a": 1})
-    '{"a":1}'
-
-    # List serialization
-    >>> _use_orjson = False
-    >>> json_dumps([1, 2, 3])
-    '[1,2,3]'
-
-    # orjson path returns unicode str
-    >>> import orjson
-    >>> _use_orjson = True
-    >>> orjson.dumps = lambda o: b'{"b":2}'
-    >>> json_dumps({"b": 2})
-    '{"b":2}'
-
-    # Non-str dict keys are coerced to str when using orjson
-    >>> _use_orjson = True
-    >>> orjson.dumps = lambda o: b'{"1":"one"}'
-    >>> json_dumps({1: "one"})
-    '{"1":"one"}'
-
-    # Error path: un-serializable object
-    >>> _use_orjson = False
+    >>> json_dumps({1: "one", "b": [1, 2]})
+    '{"1":"one","b":[1,2]}'
+
+    >>> from dataclasses import dataclass
+    >>> @dataclass
+    ... class Point:
+    ...     x: int
+    ...     y: int
+    >>> json_dumps([Point(1, 2)])
+    '[{"x":1,"y":2}]'
+
     >>> class Bad:
     ...     pass
     >>> try:
     ...     json_dumps(Bad())
     ... except RuntimeError as e:
     ...     "Failed to serialize object to JSON" in str(e)
-    '{"1":"one"}'
+    True
     """
     try:
         if _use_orjson:
-            # Ensure all dict keys are str for orjson
-            def ensure_str_keys(o):
-                if isinstance(o, dict):
-                    return {str(k): ensure_str_keys(v) for k, v in o.items()}
-                if isinstance(o, list):
-                    return [ensure_str_keys(i) for i in o]
-                return o
-
-            obj = ensure_str_keys(obj)
-            return orjson.dumps(obj).decode("utf-8")  # decode to str for consistency
-        return json.dumps(obj)
+            return orjson.dumps(obj, option=_ORJSON_OPTIONS).decode("utf-8")
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False, default=_json_default)
+    except Exception as e:
+        raise RuntimeError(f"Failed to serialize object to JSON: {e}") from e
+
+
+def json_dumps_bytes(obj: object) -> bytes:
+    """
+    Serialize to compact UTF-8 JSON bytes, ready to send as a request body or write to a binary file.
+
+    Uses orjson when installed (``pip install nosible[orjson]``), and the standard library (without
+    whitespace) otherwise. Like
+    `json_dumps`, non-str dict keys are coerced to str and dataclasses are serialized directly.
+
+    Parameters
+    ----------
+    obj : object
+        Object to serialize; must be JSON-serializable or a dataclass.
+
+    Returns
+    -------
+    bytes
+        The encoded JSON.
+
+    Raises
+    ------
+    RuntimeError
+        If serialization fails for any reason.
+
+    Examples
+    --------
+    >>> json_dumps_bytes({"a": [1, 2], "b": "é"})
+    b'{"a":[1,2],"b":"\\xc3\\xa9"}'
+    """
+    try:
+        if _use_orjson:
+            return orjson.dumps(obj, option=_ORJSON_OPTIONS)
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False, default=_json_default).encode("utf-8")
     except Exception as e:
-        # Optionally, you can log the error here
         raise RuntimeError(f"Failed to serialize object to JSON: {e}") from e
 
 
@@ -90,6 +122,8 @@ def json_loads(s: Union[bytes, str]) -> dict:
     """
     Accept both bytes (from orjson) and str (from json.loads).
 
+    Uses orjson when installed (``pip install nosible[orjson]``), and the standard library otherwise.
+
     Parameters
     ----------
     s : Union[bytes, str]
@@ -108,32 +142,24 @@ def json_loads(s: Union[bytes, str]) -> dict:
 
     Examples
     --------
+    >>> json_loads('{"a": [1, 2]}')
+    {'a': [1, 2]}
+    >>> json_loads(b'{"b": "\\xc3\\xa9"}')
+    {'b': 'é'}
+
     # Standard library path (disable orjson)
-    >>> _use_orjson = False
-    >>> json_dumps({"a": 1})
-    '{"1":"one"}'
-
-    # orjson path with monkey-patched dumping
-    >>> _use_orjson = True
-    >>> orjson.dumps = lambda o: b'{"b": 2}'
-    >>> json_dumps({"b": 2})
-    '{"b": 2}'
-
-    # Convert non-str dict keys to str when using orjson
-    >>> _use_orjson = True
-    >>> orjson.dumps = lambda o: b'{"1": "one"}'
-    >>> json_dumps({1: "one"})
-    '{"1": "one"}'
-
-    # Error path: object not serializable
-    >>> _use_orjson = False
-    >>> class Bad:
-    ...     pass
+    >>> from nosible.utils import json_tools
+    >>> use_orjson, json_tools._use_orjson = json_tools._use_orjson, False
+    >>> json_tools.json_loads(b'{"c": 3}')
+    {'c': 3}
+    >>> json_tools._use_orjson = use_orjson
+
+    # Error path: invalid JSON
     >>> try:
-    ...     json_dumps(Bad())
+    ...     json_loads("not json")
     ... except RuntimeError as e:
-    ...     "Failed to serialize" in str(e)
-    '{"1": "one"}'
+    ...     "Failed to deserialize JSON" in str(e)
+    True
     """
     try:
         if _use_orjson:
@@ -0,0 +1,205 @@
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+
+class QuotaLedger:
+    """
+    Persistent, thread-safe record of API calls per endpoint, bucketed by hour.
+
+    Calls are buffered in memory and written to SQLite in one transaction every `flush_every`
+    calls or `flush_interval` seconds (and on `flush`/`close`), so recording a call costs almost
+    nothing. Several processes may share one ledger file.
+
+    Parameters
+    ----------
+    path : str
+        Path to the SQLite file. Parent directories are created if needed.
+    key_id : str
+        Identifies the API key whose usage is recorded.
+    flush_every : int
+        Flush after this many buffered calls.
+    flush_interval : float
+        Flush when the oldest buffered call is older than this many seconds.
+
+    Examples
+    --------
+    >>> import tempfile, os
+    >>> ledger = QuotaLedger(os.path.join(tempfile.mkdtemp(), "quota.sqlite"), key_id="abc")
+    >>> ledger.record("fast")
+    >>> ledger.record("fast", 2)
+    >>> ledger.used("fast", window_s=3600)
+    3
+    >>> [calls for _, calls in ledger.hourly_usage("fast", window_s=3600)]
+    [3]
+    >>> status = ledger.status({"fast": [(60, 60), (100, 30 * 24 * 3600)]})
+    >>> status["fast"]["limit"], status["fast"]["used"], status["fast"]["remaining"]
+    (100, 3, 97)
+    >>> ledger.close()
+    """
+
+    def __init__(self, path: str, key_id: str, flush_every: int = 100, flush_interval: float = 5.0):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.path = path
+        self.key_id = key_id
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+        self._lock = threading.Lock()
+        self._pending: dict = {}
+        self._pending_calls = 0
+        self._pending_since = None
+        self._con = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        with self._lock:
+            self._con.execute("PRAGMA journal_mode=WAL")
+            self._con.execute(
+                "CREATE TABLE IF NOT EXISTS usage ("
+                "key_id TEXT NOT NULL, endpoint TEXT NOT NULL, hour INTEGER NOT NULL, calls INTEGER NOT NULL, "
+                "PRIMARY KEY (key_id, endpoint, hour))"
+            )
+            self._con.commit()
+
+    def record(self, endpoint: str, calls: int = 1) -> None:
+        """
+        Record calls made to an endpoint.
+
+        Parameters
+        ----------
+        endpoint : str
+            The rate-limit endpoint (e.g. "fast").
+        calls : int
+            Number of calls to record.
+        """
+        hour = int(time.time() // 3600)
+        with self._lock:
+            self._pending[(endpoint, hour)] = self._pending.get((endpoint, hour), 0) + calls
+            self._pending_calls += calls
+            if self._pending_since is None:
+                self._pending_since = time.monotonic()
+            if (
+                self._pending_calls >= self.flush_every
+                or time.monotonic() - self._pending_since >= self.flush_interval
+            ):
+                self._flush_locked()
+
+    def flush(self) -> None:
+        """
+        Write buffered calls to disk.
+        """
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        """
+        Write buffered calls to disk; the caller must hold the lock.
+        """
+        if not self._pending:
+            return
+        rows = [(self.key_id, endpoint, hour, calls) for (endpoint, hour), calls in self._pending.items()]
+        self._con.executemany(
+            "INSERT INTO usage (key_id, endpoint, hour, calls) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT (key_id, endpoint, hour) DO UPDATE SET calls = calls + excluded.calls",
+            rows,
+        )
+        self._con.commit()
+        self._pending.clear()
+        self._pending_calls = 0
+        self._pending_since = None
+
+    def used(self, endpoint: str, window_s: float) -> int:
+        """
+        Count the calls recorded for an endpoint within a trailing window.
+
+        Parameters
+        ----------
+        endpoint : str
+            The rate-limit endpoint.
+        window_s : float
+            Length of the window in seconds, rounded to whole hours.
+
+        Returns
+        -------
+        int
+            Number of calls in the window.
+        """
+        first_hour = int((time.time() - window_s) // 3600) + 1
+        with self._lock:
+            self._flush_locked()
+            row = self._con.execute(
+                "SELECT COALESCE(SUM(calls), 0) FROM usage WHERE key_id = ? AND endpoint = ? AND hour >= ?",
+                (self.key_id, endpoint, first_hour),
+            ).fetchone()
+        return int(row[0])
+
+    def hourly_usage(self, endpoint: str, window_s: float) -> list:
+        """
+        List the calls recorded for an endpoint within a trailing window, hour by hour.
+
+        Parameters
+        ----------
+        endpoint : str
+            The rate-limit endpoint.
+        window_s : float
+            Length of the window in seconds, rounded to whole hours.
+
+        Returns
+        -------
+        list of tuple
+            ``(hour_start_s, calls)`` pairs in ascending time order.
+        """
+        first_hour = int((time.time() - window_s) // 3600) + 1
+        with self._lock:
+            self._flush_locked()
+            rows = self._con.execute(
+                "SELECT hour, calls FROM usage WHERE key_id = ? AND endpoint = ? AND hour >= ? ORDER BY hour",
+                (self.key_id, endpoint, first_hour),
+            ).fetchall()
+        return [(hour * 3600, int(calls)) for hour, calls in rows]
+
+    def status(self, limits: dict) -> dict:
+        """
+        Summarise quota usage against the longest window of each endpoint.
+
+        The projected exhaustion time extrapolates the average hourly rate over the last 24 hours.
+
+        Parameters
+        ----------
+        limits : dict
+            Mapping of endpoint to a list of ``(max_calls, period_s)`` windows, as in `PLAN_RATE_LIMITS`.
+
+        Returns
+        -------
+        dict
+            Mapping of endpoint to a dict with ``limit``, ``window_s``, ``used``, ``remaining``,
+            ``calls_per_hour`` and ``projected_exhaustion`` (a UTC datetime, or None when the
+            endpoint is idle).
+        """
+        now = datetime.now(timezone.utc)
+        summary = {}
+        for endpoint, windows in limits.items():
+            limit, window_s = max(windows, key=lambda w: w[1])
+            used = self.used(endpoint, window_s)
+            remaining = max(limit - used, 0)
+            calls_per_hour = self.used(endpoint, 24 * 3600) / 24
+            projected: Optional[datetime] = None
+            if calls_per_hour > 0:
+                projected = now + timedelta(hours=remaining / calls_per_hour)
+            summary[endpoint] = {
+                "limit": limit,
+                "window_s": window_s,
+                "used": used,
+                "remaining": remaining,
+                "calls_per_hour": calls_per_hour,
+                "projected_exhaustion": projected,
+            }
+        return summary
+
+    def close(self) -> None:
+        """
+        Flush buffered calls and close the SQLite connection.
+        """
+        with self._lock:
+            self._flush_locked()
+            self._con.close()
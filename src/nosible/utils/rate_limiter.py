@@ -1,13 +1,22 @@
+import contextlib
 import functools
 import logging
+import os
+import re
+import threading
 import time
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING, Callable, Optional
 
-from pyrate_limiter import Limiter, Rate
-from pyrate_limiter.buckets.in_memory_bucket import InMemoryBucket
-from pyrate_limiter.exceptions import BucketFullException
+from nosible.utils.scheduling import current_priority
+
+if TYPE_CHECKING:
+    from pyrate_limiter.buckets.sqlite_bucket import SQLiteBucket
 
 log = logging.getLogger(__name__)
 
+RATE_LIMIT_BACKENDS = ("memory", "sqlite")
+
 PLAN_RATE_LIMITS = {
     "test": {
         # Per minute limit, then per month.
@@ -79,6 +88,247 @@ PLAN_RATE_LIMITS = {
     },
 }
 
+# Maximum requests in flight per endpoint (the same on every plan); endpoints not listed are bounded by the
+# client's `concurrency`.
+ENDPOINT_CONCURRENCY_LIMITS = {"bulk": 1}
+
+
+class RateLimitError(ValueError):
+    """
+    Raised when the NOSIBLE API answers with HTTP 429.
+
+    Parameters
+    ----------
+    message : str
+        Human-readable error message.
+    retry_after : float, optional
+        Seconds the server asked us to wait before retrying, if it said.
+
+    Examples
+    --------
+    >>> err = RateLimitError("You have hit your rate limit.", retry_after=2.0)
+    >>> isinstance(err, ValueError), err.retry_after
+    (True, 2.0)
+    """
+
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class ConcurrencyLimitError(ValueError):
+    """
+    Raised when the NOSIBLE API keeps answering HTTP 409 (too many concurrent requests).
+
+    Examples
+    --------
+    >>> isinstance(ConcurrencyLimitError("Too many concurrent searches."), ValueError)
+    True
+    """
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a ``Retry-After`` header into a number of seconds.
+
+    Parameters
+    ----------
+    value : str, optional
+        The header value: either delay-seconds or an HTTP date.
+
+    Returns
+    -------
+    float or None
+        Seconds to wait (never negative), or None if the header is missing or malformed.
+
+    Examples
+    --------
+    >>> parse_retry_after("3")
+    3.0
+    >>> parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT")
+    0.0
+    >>> parse_retry_after(None) is None, parse_retry_after("soon") is None
+    (True, True)
+    """
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+def wait_retry_after(fallback: Callable) -> Callable:
+    """
+    Build a tenacity wait strategy that honours the server's ``Retry-After``.
+
+    Parameters
+    ----------
+    fallback : callable
+        The tenacity wait strategy used otherwise (e.g. ``wait_exponential(...)``).
+
+    Returns
+    -------
+    callable
+        A wait strategy waiting at least `RateLimitError.retry_after` seconds after a 429.
+    """
+
+    def wait(retry_state) -> float:
+        delay = fallback(retry_state)
+        exc = retry_state.outcome.exception() if retry_state.outcome is not None else None
+        if isinstance(exc, RateLimitError) and exc.retry_after is not None:
+            return max(delay, exc.retry_after)
+        return delay
+
+    return wait
+
+
+@functools.lru_cache(maxsize=None)
+def _pyrate():
+    """
+    Import the pyrate_limiter classes used here, once, on first use.
+
+    pyrate_limiter is not imported at module level to keep `import nosible` fast; caching the
+    lookup keeps the import machinery out of the limiter's polling loop.
+
+    Returns
+    -------
+    types.SimpleNamespace
+        ``Limiter``, ``Rate``, ``RateItem``, ``InMemoryBucket`` and ``BucketFullException``.
+    """
+    import types
+
+    from pyrate_limiter import Limiter, Rate, RateItem
+    from pyrate_limiter.buckets.in_memory_bucket import InMemoryBucket
+    from pyrate_limiter.exceptions import BucketFullException
+
+    return types.SimpleNamespace(
+        Limiter=Limiter,
+        Rate=Rate,
+        RateItem=RateItem,
+        InMemoryBucket=InMemoryBucket,
+        BucketFullException=BucketFullException,
+    )
+
+
+def check_rate_limit_backend(backend: str) -> None:
+    """
+    Make sure `backend` names a known rate-limit backend.
+
+    Parameters
+    ----------
+    backend : str
+        One of "memory" or "sqlite".
+
+    Raises
+    ------
+    ValueError
+        If the backend is unknown.
+
+    Examples
+    --------
+    >>> check_rate_limit_backend("sqlite")
+    >>> check_rate_limit_backend("redis")
+    Traceback (most recent call last):
+    ...
+    ValueError: Unknown rate limit backend 'redis': expected one of 'memory', 'sqlite'.
+    """
+    if backend not in RATE_LIMIT_BACKENDS:
+        raise ValueError(
+            f"Unknown rate limit backend {backend!r}: expected one of "
+            + ", ".join(repr(b) for b in RATE_LIMIT_BACKENDS)
+            + "."
+        )
+
+
+def check_rate_limit_db(db_path: Optional[str]) -> None:
+    """
+    Make sure `db_path` can hold a SQLite rate-limit bucket.
+
+    Parameters
+    ----------
+    db_path : str, optional
+        Path to the SQLite file. None uses the default file in the nosible cache directory.
+
+    Raises
+    ------
+    ValueError
+        If `db_path` does not end in ``.sqlite``.
+
+    Examples
+    --------
+    >>> check_rate_limit_db("/tmp/nosible-ratelimits.sqlite")
+    >>> check_rate_limit_db("/tmp/nosible-ratelimits.db")
+    Traceback (most recent call last):
+    ...
+    ValueError: rate_limit_db must be a path ending in '.sqlite', got '/tmp/nosible-ratelimits.db'.
+    """
+    if db_path is not None and not os.fspath(db_path).endswith(".sqlite"):
+        raise ValueError(f"rate_limit_db must be a path ending in '.sqlite', got {db_path!r}.")
+
+
+def _sqlite_bucket(rates: list, db_path: Optional[str], name: str) -> "SQLiteBucket":
+    """
+    Open (or create) a SQLite-backed bucket shared by every process using the same file and name.
+
+    Parameters
+    ----------
+    rates : list of Rate
+        The rates the bucket enforces.
+    db_path : str, optional
+        Path to the SQLite file (must end in ``.sqlite``). Defaults to ``ratelimits.sqlite`` in
+        the nosible cache directory.
+    name : str
+        Identifies the budget; limiters with the same name share one table.
+
+    Returns
+    -------
+    SQLiteBucket
+        The shared bucket.
+    """
+    from pyrate_limiter.buckets.sqlite_bucket import SQLiteBucket
+
+    if db_path is None:
+        from nosible.utils.disk_cache import default_cache_dir
+
+        db_path = os.path.join(default_cache_dir(), "ratelimits.sqlite")
+    os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+
+    # Serialise check-and-insert across processes when filelock (pip install nosible[sqlite]) is available;
+    # otherwise rely on SQLite locking.
+    try:
+        import filelock  # noqa: F401
+
+        use_file_lock = True
+    except ImportError:
+        use_file_lock = False
+
+    table = "rl_" + re.sub(r"\W", "_", name)
+    return SQLiteBucket.init_from_file(rates, table=table, db_path=db_path, use_file_lock=use_file_lock)
+
+
+def _acquire_all(limiters: list, timeout: Optional[float] = None) -> None:
+    """
+    Acquire one call from each limiter, within an optional deadline shared by all of them.
+
+    Parameters
+    ----------
+    limiters : list of RateLimiter
+        The limiters guarding one endpoint.
+    timeout : float, optional
+        Maximum total seconds to wait; exceeding it raises TimeoutError.
+    """
+    deadline = time.monotonic() + timeout if timeout is not None else None
+    for rl in limiters:
+        if deadline is None:
+            rl.acquire()
+        else:
+            rl.acquire(timeout=max(deadline - time.monotonic(), 0.0))
+
 
 def _rate_limited(endpoint):
     """
@@ -90,8 +340,7 @@ def _rate_limited(endpoint):
         @functools.wraps(fn)
         def wrapper(self, *args, **kwargs):
             # print(f"[RATE LIMIT] enforcing {endpoint}")
-            for rl in self._limiters[endpoint]:
-                rl.acquire()
+            _acquire_all(self._limiters[endpoint], getattr(self, "rate_limit_timeout", None))
             return fn(self, *args, **kwargs)
 
         return wrapper
@@ -102,11 +351,33 @@ def _rate_limited(endpoint):
 class RateLimiter:
     """
     Thread-safe sliding-window rate limiter via PyrateLimiter.
+
+    All windows of a limiter are checked and recorded atomically, so a call never consumes a
+    per-minute slot while it still has to wait on the monthly window.
+
+    When several threads wait, those running more urgent work (a lower `current_priority`, e.g.
+    interactive searches) are let through first; batch work only uses capacity nobody more urgent
+    is waiting for.
+
+    On top of the static windows, the limiter adapts to feedback from the server using AIMD
+    (additive increase, multiplicative decrease): each 429 halves the allowed rate and can pause
+    calls until ``Retry-After``, and each successful call raises the rate again by one call per
+    window until it is back at `max_calls`.
     """
 
     _GLOBAL_KEY = "nosible"
+    # Lowest fraction of `max_calls` AIMD may throttle down to.
+    _MIN_FACTOR = 0.05
 
-    def __init__(self, max_calls: int, period_s: float):
+    def __init__(
+        self,
+        max_calls: int,
+        period_s: float,
+        backend: str = "memory",
+        db_path: Optional[str] = None,
+        name: str = "nosible",
+        windows: Optional[list] = None,
+    ):
         """
         Initialize the RateLimiter.
 
@@ -116,26 +387,244 @@ class RateLimiter:
             Maximum number of calls allowed within each time window.
         period_s : float
             Length of the rolling window, in seconds.
+        backend : {"memory", "sqlite"}
+            Where calls are recorded. "memory" keeps them in this process; "sqlite" stores them
+            in a SQLite file so every process on the host using the same `db_path` and `name`
+            shares one budget (``pip install nosible[sqlite]`` makes this strictly atomic).
+        db_path : str, optional
+            SQLite file for the "sqlite" backend, ending in ``.sqlite`` (defaults to
+            ``ratelimits.sqlite`` in the nosible cache directory).
+        name : str
+            Identifies the shared budget for the "sqlite" backend.
+        windows : list of tuple, optional
+            Further ``(max_calls, period_s)`` windows (e.g. a monthly quota) enforced together
+            with the main one. Longer windows must allow more calls.
 
         Raises
         ------
         ValueError
-            If max_calls is not positive or period_s is not positive.
+            If `backend` is not a known backend, or `db_path` does not end in ``.sqlite``.
 
         Examples
         --------
         >>> rl = RateLimiter(5, 2.0)
         >>> isinstance(rl, RateLimiter)
         True
+        >>> RateLimiter(5, 2.0, backend="redis")
+        Traceback (most recent call last):
+        ...
+        ValueError: Unknown rate limit backend 'redis': expected one of 'memory', 'sqlite'.
         """
-        # PyrateLimiter expects interval in ms
-        period_ms = int(period_s * 1000)
+        check_rate_limit_backend(backend)
+        pyrate = _pyrate()
+
+        # PyrateLimiter expects interval in ms, and rates ordered by interval
+        all_windows = sorted([(max_calls, period_s), *(windows or [])], key=lambda w: w[1])
+        rates = [pyrate.Rate(calls, int(period * 1000)) for calls, period in all_windows]
 
         # Build our bucket
-        bucket = InMemoryBucket([Rate(max_calls, period_ms)])
-        self._limiter = Limiter(bucket)
+        if backend == "memory":
+            bucket = pyrate.InMemoryBucket(rates)
+        else:
+            check_rate_limit_db(db_path)
+            bucket = _sqlite_bucket(rates, db_path=db_path, name=name)
+        self.backend = backend
+        self.windows = all_windows
+        self._bucket = bucket
+        self._limiter = pyrate.Limiter(bucket)
+
+        # Adaptive state: the fraction of max_calls currently allowed, and when the next call may start.
+        self.max_calls = max_calls
+        self.period_s = period_s
+        self._state_lock = threading.Lock()
+        self._factor = 1.0
+        self._blocked_until = 0.0
+        self._next_slot = 0.0
+        # Number of blocked waiters per priority.
+        self._waiters: dict = {}
+
+    @property
+    def factor(self) -> float:
+        """
+        Fraction of `max_calls` currently allowed by the adaptive (AIMD) throttle.
+
+        Returns
+        -------
+        float
+            A value in (0, 1]; 1.0 means no adaptive throttling.
+        """
+        return self._factor
+
+    def preload(self, usage: list) -> int:
+        """
+        Count calls made before this limiter existed (e.g. by an earlier process) against its windows.
+
+        Calls are dated no later than one shortest window ago, so they only weigh on the longer
+        windows, and at most the longest window's limit is loaded. Only the memory backend is
+        seeded; the sqlite backend already keeps its state across restarts.
+
+        Parameters
+        ----------
+        usage : list of tuple
+            ``(timestamp_s, calls)`` pairs, such as `QuotaLedger.hourly_usage` returns.
+
+        Returns
+        -------
+        int
+            Number of calls loaded into the limiter.
+
+        Examples
+        --------
+        >>> rl = RateLimiter(2, 1.0, windows=[(5, 3600)])
+        >>> rl.preload([(time.time() - 600, 4)])
+        4
+        >>> rl.try_acquire(), rl.try_acquire()
+        (True, False)
+        """
+        if self.backend != "memory":
+            return 0
+        latest_ms = int((time.time() - self.windows[0][1]) * 1000)
+        budget = self.windows[-1][0]
+        items = []
+        for timestamp_s, calls in sorted(usage):
+            calls = min(int(calls), budget - len(items))
+            if calls <= 0:
+                break
+            item = _pyrate().RateItem(self._GLOBAL_KEY, min(int(timestamp_s * 1000), latest_ms))
+            items.extend([item] * calls)
+        with self._state_lock:
+            self._bucket.items = sorted(items + self._bucket.items, key=lambda item: item.timestamp)
+        return len(items)
+
+    def penalize(self, retry_after: Optional[float] = None) -> None:
+        """
+        Record a 429 response: halve the allowed rate and optionally pause.
+
+        Parameters
+        ----------
+        retry_after : float, optional
+            Seconds the server asked us to wait; no call is let through until then.
+
+        Examples
+        --------
+        >>> rl = RateLimiter(10, 1.0)
+        >>> rl.penalize(retry_after=0.0)
+        >>> rl.factor
+        0.5
+        """
+        with self._state_lock:
+            self._factor = max(self._factor / 2, self._MIN_FACTOR)
+            if retry_after is not None:
+                self._blocked_until = max(self._blocked_until, time.monotonic() + retry_after)
+        log.info(f"Rate limited by server: throttling to {self._factor:.0%} of {self.max_calls} calls")
+
+    def reward(self) -> None:
+        """
+        Record a successful call: raise the allowed rate by one call per window.
+
+        Examples
+        --------
+        >>> rl = RateLimiter(10, 1.0)
+        >>> rl.penalize()
+        >>> rl.reward()
+        >>> rl.factor
+        0.6
+        """
+        with self._state_lock:
+            self._factor = min(self._factor + 1 / self.max_calls, 1.0)
+
+    def observe(self, headers) -> None:
+        """
+        Pause until the server's window resets when its rate-limit headers say it is exhausted.
+
+        Understands ``X-RateLimit-Remaining``/``X-RateLimit-Reset`` and the unprefixed
+        ``RateLimit-Remaining``/``RateLimit-Reset``. The reset may be given in seconds or as a
+        Unix timestamp.
+
+        Parameters
+        ----------
+        headers : Mapping
+            Response headers.
+
+        Examples
+        --------
+        >>> rl = RateLimiter(10, 1.0)
+        >>> rl.observe({"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "30"})
+        >>> rl.try_acquire()
+        False
+        """
+        remaining = headers.get("X-RateLimit-Remaining", headers.get("RateLimit-Remaining"))
+        reset = headers.get("X-RateLimit-Reset", headers.get("RateLimit-Reset"))
+        try:
+            if remaining is None or int(float(remaining)) > 0 or reset is None:
+                return
+            reset_s = float(reset)
+        except ValueError:
+            return
+        if reset_s > 1e9:
+            # An absolute Unix timestamp rather than a delay.
+            reset_s -= time.time()
+        with self._state_lock:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + max(reset_s, 0.0))
+
+    def _poll(self, priority: int) -> float:
+        """
+        Try to take a slot without blocking.
+
+        Parameters
+        ----------
+        priority : int
+            Priority of the caller; slots are left for more urgent waiters.
+
+        Returns
+        -------
+        float
+            0.0 if a slot was taken, otherwise the number of seconds to wait before trying again.
+        """
+        bucket_full = _pyrate().BucketFullException
+        with self._state_lock:
+            now = time.monotonic()
+            ready = max(self._blocked_until, self._next_slot)
+            if now < ready:
+                return ready - now
+            if any(p < priority for p, n in self._waiters.items() if n):
+                # Leave the slot to more urgent work.
+                return 0.01
+            try:
+                self._limiter.try_acquire(self._GLOBAL_KEY)
+            except bucket_full as exc:
+                # ms until the failing window has room for this call again
+                wait_ms = self._bucket.waiting(exc.item)
+                if not isinstance(wait_ms, int) or wait_ms < 0:
+                    wait_ms = 0
+                # Ensure at least a small sleep if rounding to zero
+                return max(wait_ms / 1000.0, 0.01)
+            if self._factor < 1.0:
+                # Space calls out evenly at the reduced rate.
+                self._next_slot = now + self.period_s / (self.max_calls * self._factor)
+            return 0.0
+
+    @staticmethod
+    def _check_deadline(wait_s: float, deadline: Optional[float]) -> None:
+        """
+        Raise TimeoutError if waiting `wait_s` more seconds would pass `deadline`.
 
-    def acquire(self) -> None:
+        Parameters
+        ----------
+        wait_s : float
+            The wait about to happen.
+        deadline : float, optional
+            `time.monotonic` deadline, or None for no deadline.
+
+        Raises
+        ------
+        TimeoutError
+            If the wait would overrun the deadline.
+        """
+        if deadline is not None and time.monotonic() + wait_s > deadline:
+            raise TimeoutError(f"Rate limit wait of {wait_s:.2f}s exceeds the timeout.")
+
+    def acquire(self, timeout: Optional[float] = None) -> None:
         """
         Block until a slot is available under the rate limit.
 
@@ -144,38 +633,98 @@ class RateLimiter:
         less than max_calls.  Once a slot is free, it records
         the call and returns.
 
+        Parameters
+        ----------
+        timeout : float, optional
+            Give up, without taking a slot, as soon as it is clear the wait would last longer
+            than this many seconds. None waits as long as needed.
+
         Raises
         ------
-        BucketFullException
-            If the limiter is configured to never delay and the bucket is full.
+        TimeoutError
+            If no slot can be taken within `timeout`.
 
         Examples
         --------
         >>> rl = RateLimiter(1, 10.0)
         >>> rl.acquire()  # first call always passes
-        >>> # Second call within 10 seconds will block until the window resets
-        >>> start = time.monotonic(); rl.acquire(); end = time.monotonic()
-        >>> end - start >= 10.0
-        True
+        >>> rl.acquire(timeout=0.1)  # the next slot is ~10s away, so fail fast  # doctest: +ELLIPSIS
+        Traceback (most recent call last):
+        ...
+        TimeoutError: Rate limit wait of ...s exceeds the timeout.
         """
-        waited = False
-        while True:
-            try:
-                self._limiter.try_acquire(self._GLOBAL_KEY)
-                if waited:
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        priority = current_priority()
+        wait_s = self._poll(priority)
+        if wait_s == 0.0:
+            return
+        self._check_deadline(wait_s, deadline)
+        log.info(f"Waiting on rate limit: sleeping {wait_s * 1000:.3f}s")
+        with self._waiting(priority):
+            while True:
+                time.sleep(wait_s)
+                wait_s = self._poll(priority)
+                if wait_s == 0.0:
                     log.info("Resumed after wait")
-                return
-            except BucketFullException as exc:
-                # exc.meta_info['remaining_time'] is ms until next token
-                wait_ms = exc.meta_info.get("remaining_time", 0)
-                wait_s = max(wait_ms / 1000.0, 0.01)
+                    return
+                self._check_deadline(wait_s, deadline)
 
-                if not waited:
-                    log.info(f"Waiting on rate limit: sleeping {wait_s * 1000:.3f}s")
-                    waited = True
+    async def acquire_async(self, timeout: Optional[float] = None) -> None:
+        """
+        Wait for a slot under the rate limit without blocking the event loop.
 
-                # Ensure at least a small sleep if rounding to zero
-                time.sleep(wait_s)
+        Parameters
+        ----------
+        timeout : float, optional
+            Give up, without taking a slot, as soon as it is clear the wait would last longer
+            than this many seconds. None waits as long as needed.
+
+        Raises
+        ------
+        TimeoutError
+            If no slot can be taken within `timeout`.
+
+        Examples
+        --------
+        >>> import asyncio
+        >>> rl = RateLimiter(2, 10.0)
+        >>> asyncio.run(rl.acquire_async())
+        >>> rl.try_acquire(), rl.try_acquire()
+        (True, False)
+        """
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        priority = current_priority()
+        wait_s = self._poll(priority)
+        if wait_s == 0.0:
+            return
+        self._check_deadline(wait_s, deadline)
+        import asyncio  # only async callers pay for importing asyncio
+
+        with self._waiting(priority):
+            while True:
+                await asyncio.sleep(wait_s)
+                wait_s = self._poll(priority)
+                if wait_s == 0.0:
+                    return
+                self._check_deadline(wait_s, deadline)
+
+    @contextlib.contextmanager
+    def _waiting(self, priority: int):
+        """
+        Register a blocked waiter of the given priority for the duration of the block.
+
+        Parameters
+        ----------
+        priority : int
+            The waiter's priority.
+        """
+        with self._state_lock:
+            self._waiters[priority] = self._waiters.get(priority, 0) + 1
+        try:
+            yield
+        finally:
+            with self._state_lock:
+                self._waiters[priority] -= 1
 
     def try_acquire(self) -> bool:
         """
@@ -196,8 +745,130 @@ class RateLimiter:
         >>> rl.try_acquire()
         False
         """
+        return self._poll(current_priority()) == 0.0
+
+
+class ConcurrencyLimiter:
+    """
+    Thread-safe cap on the number of requests in flight, adapting to the server's limit.
+
+    Each HTTP 409 lowers the cap to one below the number of requests that were in flight; after
+    a full cap's worth of successful requests it grows by one again, up to `max_limit`.
+
+    Parameters
+    ----------
+    max_limit : int
+        The largest number of concurrent requests to allow.
+
+    Examples
+    --------
+    >>> cl = ConcurrencyLimiter(2)
+    >>> with cl.slot():
+    ...     cl.in_flight
+    1
+    >>> cl.acquire(); cl.acquire()
+    >>> cl.acquire(timeout=0.01)
+    Traceback (most recent call last):
+    ...
+    TimeoutError: No concurrency slot became free within 0.01s.
+    """
+
+    def __init__(self, max_limit: int):
+        self.max_limit = max_limit
+        self.limit = max_limit
+        self.in_flight = 0
+        self._successes = 0
+        self._releases = 0
+        self._cond = threading.Condition()
+
+    def acquire(self, timeout: Optional[float] = None) -> None:
+        """
+        Block until fewer than `limit` requests are in flight, then take a slot.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            Maximum seconds to wait. None waits as long as needed.
+
+        Raises
+        ------
+        TimeoutError
+            If no slot became free within `timeout`.
+        """
+        with self._cond:
+            if not self._cond.wait_for(lambda: self.in_flight < self.limit, timeout=timeout):
+                raise TimeoutError(f"No concurrency slot became free within {timeout}s.")
+            self.in_flight += 1
+
+    def release(self) -> None:
+        """
+        Give a slot back and wake up waiters.
+        """
+        with self._cond:
+            self.in_flight -= 1
+            self._releases += 1
+            self._cond.notify_all()
+
+    @contextlib.contextmanager
+    def slot(self, timeout: Optional[float] = None):
+        """
+        Hold a slot for the duration of the block.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            Maximum seconds to wait for the slot.
+        """
+        self.acquire(timeout=timeout)
         try:
-            self._limiter.try_acquire(self._GLOBAL_KEY)
-            return True
-        except BucketFullException:
-            return False
+            yield
+        finally:
+            self.release()
+
+    def reject(self) -> None:
+        """
+        Record a 409 for a request that currently holds a slot: lower the cap below the load that was rejected.
+
+        Examples
+        --------
+        >>> cl = ConcurrencyLimiter(8)
+        >>> for _ in range(4):
+        ...     cl.acquire()
+        >>> cl.reject()
+        >>> cl.limit
+        3
+        """
+        with self._cond:
+            self.limit = max(1, min(self.limit, self.in_flight - 1))
+            self._successes = 0
+
+    def accept(self) -> None:
+        """
+        Record a successful request, growing the cap by one after `limit` successes in a row.
+        """
+        with self._cond:
+            if self.limit >= self.max_limit:
+                return
+            self._successes += 1
+            if self._successes >= self.limit:
+                self.limit += 1
+                self._successes = 0
+                self._cond.notify_all()
+
+    def wait_for_release(self, timeout: float) -> bool:
+        """
+        Wait until another request gives its slot back.
+
+        Parameters
+        ----------
+        timeout : float
+            Maximum seconds to wait.
+
+        Returns
+        -------
+        bool
+            True if a slot was released, False if the wait timed out.
+        """
+        with self._cond:
+            releases = self._releases
+            return self._cond.wait_for(lambda: self._releases > releases, timeout=timeout)
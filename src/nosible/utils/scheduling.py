@@ -0,0 +1,194 @@
+import itertools
+import queue
+import threading
+import weakref
+from concurrent.futures import Future
+from typing import Callable
+
+# Lower numbers are served first.
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BATCH = 10
+
+_local = threading.local()
+
+# Live executors, shut down (and joined) when the interpreter exits.
+_executors = weakref.WeakSet()
+_exiting = False
+
+
+def _python_exit() -> None:
+    """
+    Let every live executor finish its queued tasks, then join its workers.
+    """
+    global _exiting
+    _exiting = True
+    for executor in list(_executors):
+        executor.shutdown(wait=True)
+
+
+# Like ThreadPoolExecutor, join the non-daemon workers before the interpreter waits on them.
+threading._register_atexit(_python_exit)
+
+
+def current_priority() -> int:
+    """
+    Return the priority of the work running on the current thread.
+
+    Tasks run by a `PriorityExecutor` carry the priority they were submitted with; any other
+    thread counts as interactive.
+
+    Returns
+    -------
+    int
+        The current priority (lower is more urgent).
+
+    Examples
+    --------
+    >>> current_priority() == PRIORITY_INTERACTIVE
+    True
+    >>> with PriorityExecutor(max_workers=1) as pool:
+    ...     pool.submit(current_priority, priority=PRIORITY_BATCH).result()
+    10
+    """
+    return getattr(_local, "priority", PRIORITY_INTERACTIVE)
+
+
+class PriorityExecutor:
+    """
+    Thread pool that runs queued tasks in priority order.
+
+    A drop-in replacement for `concurrent.futures.ThreadPoolExecutor` where `submit` accepts a
+    `priority`: when workers are busy, queued tasks with a lower priority number start first and
+    tasks of equal priority run in submission order. While a task runs, `current_priority`
+    returns its priority, so the rate limiters can favour the same work. Workers are started
+    only when no idle worker can take the task, and are joined on shutdown and at interpreter
+    exit.
+
+    Parameters
+    ----------
+    max_workers : int
+        Number of worker threads.
+    thread_name_prefix : str
+        Prefix for the worker thread names.
+
+    Examples
+    --------
+    >>> import threading
+    >>> gate = threading.Event()
+    >>> order = []
+    >>> with PriorityExecutor(max_workers=1) as pool:
+    ...     _ = pool.submit(gate.wait)
+    ...     _ = pool.submit(order.append, "batch", priority=PRIORITY_BATCH)
+    ...     _ = pool.submit(order.append, "interactive", priority=PRIORITY_INTERACTIVE)
+    ...     gate.set()
+    >>> order
+    ['interactive', 'batch']
+    """
+
+    def __init__(self, max_workers: int, thread_name_prefix: str = "nosible"):
+        if max_workers <= 0:
+            raise ValueError("max_workers must be greater than 0")
+        self.max_workers = max_workers
+        self._thread_name_prefix = thread_name_prefix
+        self._queue = queue.PriorityQueue()
+        self._counter = itertools.count()
+        self._threads: list = []
+        self._idle_semaphore = threading.Semaphore(0)
+        self._lock = threading.Lock()
+        self._shutdown = False
+        _executors.add(self)
+
+    def submit(self, fn: Callable, /, *args, priority: int = PRIORITY_INTERACTIVE, **kwargs) -> Future:
+        """
+        Schedule `fn(*args, **kwargs)` to run with the given priority.
+
+        Parameters
+        ----------
+        fn : callable
+            The function to run.
+        *args
+            Positional arguments for `fn`.
+        priority : int
+            Lower numbers run first.
+        **kwargs
+            Keyword arguments for `fn`.
+
+        Returns
+        -------
+        concurrent.futures.Future
+            Resolves to the function's return value.
+
+        Raises
+        ------
+        RuntimeError
+            If the executor has been shut down.
+        """
+        future = Future()
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError("cannot schedule new futures after shutdown")
+            if _exiting:
+                raise RuntimeError("cannot schedule new futures after interpreter shutdown")
+            self._queue.put((priority, next(self._counter), future, fn, args, kwargs))
+            self._adjust_thread_count()
+        return future
+
+    def _adjust_thread_count(self) -> None:
+        """
+        Start a worker for the task just queued, unless an idle one can take it.
+        """
+        if self._idle_semaphore.acquire(timeout=0):
+            return
+        if len(self._threads) < self.max_workers:
+            thread = threading.Thread(target=self._work, name=f"{self._thread_name_prefix}_{len(self._threads)}")
+            thread.start()
+            self._threads.append(thread)
+
+    def _work(self) -> None:
+        """
+        Worker loop: run queued tasks until a shutdown sentinel arrives.
+        """
+        while True:
+            priority, _, future, fn, args, kwargs = self._queue.get()
+            if future is None:
+                return
+            if future.set_running_or_notify_cancel():
+                _local.priority = priority
+                try:
+                    result = fn(*args, **kwargs)
+                except BaseException as exc:
+                    future.set_exception(exc)
+                else:
+                    future.set_result(result)
+                finally:
+                    _local.priority = PRIORITY_INTERACTIVE
+            # Drop references to the finished task before waiting for the next one.
+            del future, fn, args, kwargs
+            self._idle_semaphore.release()
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stop accepting work; queued tasks still run before the workers exit.
+
+        Parameters
+        ----------
+        wait : bool
+            Block until all queued tasks have finished.
+        """
+        with self._lock:
+            if not self._shutdown:
+                self._shutdown = True
+                for _ in self._threads:
+                    # Sentinels sort after every real task.
+                    self._queue.put((float("inf"), next(self._counter), None, None, None, None))
+            threads = list(self._threads)
+        if wait:
+            for thread in threads:
+                if thread is not threading.current_thread():
+                    thread.join()
+
+    def __enter__(self) -> "PriorityExecutor":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.shutdown(wait=True)
@@ -63,3 +63,136 @@ def test_csv_polars_pandas_json_ndjson_parquet_arrow_duckdb_io(tmp_path, simple_
     db_path = tmp_path / "r.duckdb"
     assert str(rs.write_duckdb(file_path=db_path, table_name="t")).endswith(".duckdb")
     assert rs == ResultSet.read_duckdb(db_path)
+
+
+def test_polars_view_is_cached_and_invalidated(simple_results):
+    rs = ResultSet(list(simple_results))
+    df = rs.to_polars()
+    assert rs.to_polars() is not df
+
+    # Mutating a returned frame must not leak into the cache.
+    df.drop_in_place("title")
+    assert "title" in rs.to_polars().columns
+
+    # Replacing, appending and editing results need an explicit invalidation.
+    rs.results[0] = Result(url="https://nosible.ai", title="NOSIBLE")
+    rs.results.append(Result(url="https://example.org", title="Other"))
+    assert rs.to_polars()["title"].to_list() == ["Example Domain", "OpenAI"]
+    rs.invalidate_cache()
+    assert rs.to_polars()["title"].to_list() == ["NOSIBLE", "OpenAI", "Other"]
+
+    rs.results[0].title = "Renamed"
+    rs.invalidate_cache()
+    assert rs.to_polars()["title"][0] == "Renamed"
+
+    pdf = rs.to_pandas(zero_copy=True)
+    assert list(pdf["title"]) == ["Renamed", "OpenAI", "Other"]
+
+
+def test_add_single_result(simple_results):
+    rs = ResultSet(simple_results[:1])
+    combined = rs + simple_results[1]
+    assert len(combined) == 2
+    assert len(rs) == 1
+
+
+def test_sql_over_results():
+    rs = ResultSet(
+        [
+            Result(url="https://a.com/1", netloc="a.com", similarity=0.9, url_hash="a1"),
+            Result(url="https://a.com/2", netloc="a.com", similarity=0.7, url_hash="a2"),
+            Result(url="https://b.org/1", netloc="b.org", similarity=0.4, url_hash="b1"),
+        ]
+    )
+    filtered = rs.sql("SELECT * FROM results WHERE netloc = 'a.com'")
+    assert isinstance(filtered, ResultSet)
+    assert filtered == ResultSet(rs.results[:2])
+
+    table = rs.sql("SELECT netloc, count(*) AS n FROM hits GROUP BY 1 ORDER BY 1", table_name="hits", as_arrow=True)
+    assert table.column("n").to_pylist() == [2, 1]
+
+    with pytest.raises(RuntimeError):
+        rs.sql("SELECT * FROM missing_table")
+
+
+def test_scan_archive_with_pushdown(tmp_path):
+    import polars as pl
+
+    from nosible import LazyResultSet
+
+    archive = tmp_path / "archive"
+    archive.mkdir()
+    ResultSet([Result(url="https://a.com", netloc="a.com", similarity=0.9, url_hash="a")]).write_parquet(
+        str(archive / "one.parquet")
+    )
+    ResultSet(
+        [
+            Result(url="https://b.org", netloc="b.org", similarity=0.3, url_hash="b"),
+            Result(url="https://c.net", netloc="c.net", similarity=0.8, author="Jane", url_hash="c"),
+        ]
+    ).write_parquet(str(archive / "two.parquet"))
+
+    lazy = ResultSet.scan(str(archive / "*.parquet"), filters=pl.col("similarity") > 0.5)
+    assert isinstance(lazy, LazyResultSet)
+    assert {r.url_hash for r in lazy.collect()} == {"a", "c"}
+
+    projected = ResultSet.scan(str(archive / "*.parquet"), filters={"netloc": ["b.org", "c.net"]}, columns=["url"])
+    assert projected.to_polars().columns == ["url"]
+    assert len(projected.head(1).collect()) == 1
+
+    with pytest.raises(ValueError):
+        ResultSet.scan(str(archive / "*.csv"))
+
+
+def test_to_polars_infers_mixed_types():
+    import polars as pl
+
+    mixed = ResultSet([Result(url="https://a.com", title=5), Result(url="https://b.org", title="B")]).to_polars()
+    assert mixed["title"].to_list() == ["5", "B"]
+
+    numeric = ResultSet([Result(url="https://a.com", title=5, similarity=1)]).to_polars()
+    assert numeric.schema["title"] == pl.Int64
+    assert numeric.schema["similarity"] == pl.Float64
+    # All-null columns stay string typed.
+    assert numeric.schema["author"] == pl.Utf8
+
+
+def test_from_json_matches_dict_path(monkeypatch):
+    import nosible.classes.result_set as rs_mod
+
+    pytest.importorskip("msgspec")
+
+    body = (
+        b'{"response": ['
+        b'{"url": "https://a.com", "title": "A", "similarity": 0.9, "extra": [1, 2], "url_hash": "a"},'
+        b'{"url": "https://b.com", "semantics": {"similarity": 0.5, "other": 1}},'
+        b'{"url": "https://c.com", "similarity": null, "semantics": {"similarity": 0.4}},'
+        b'{"netloc": "d.com", "published": "2024-01-01", "language": "en", "content": "body"}'
+        b'], "query": "q"}'
+    )
+    fast = ResultSet.from_json(body)
+    fast_limited = ResultSet.from_json(body, limit=2)
+    monkeypatch.setattr(rs_mod, "_msgspec_decoder", lambda: None)
+    slow = ResultSet.from_json(body)
+    assert [r.to_dict() for r in fast] == [r.to_dict() for r in slow]
+    assert fast_limited.results == ResultSet.from_json(body, limit=2).results
+    assert [r.similarity for r in fast] == [0.9, 0.5, None, None]
+    # Bodies that don't fit the schema still decode through the dict path.
+    monkeypatch.undo()
+    odd = ResultSet.from_json(b'{"response": [{"url": "https://c.com", "title": 5}]}')
+    assert odd[0].title == 5
+
+
+def test_write_json_and_ndjson_stream_to_binary_handles(tmp_path, simple_results):
+    import io
+
+    rs = ResultSet(simple_results)
+    for write in (rs.write_json, rs.write_ndjson):
+        expected = write()
+        buf = io.BytesIO()
+        assert write(buf) is buf
+        assert buf.getvalue().decode("utf-8") == expected
+        path = tmp_path / "out"
+        assert write(path) == path
+        assert path.read_text(encoding="utf-8") == expected
+    assert ResultSet([]).write_json(io.BytesIO()).getvalue() == b"[]"
@@ -70,3 +70,44 @@ def test_sentiment_monkeypatch_and_scrape_url():
         return 0.5
     r.sentiment = types.MethodType(fake_sent, r)
     assert r.sentiment(DummyClient()) == 0.5
+
+
+def test_resultset_sentiment_batches_and_caches(tmp_path):
+    from types import SimpleNamespace
+
+    from nosible import ResultSet
+
+    prompts = []
+
+    class FakeOpenAI:
+        def __init__(self, **kwargs):
+            self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+        def create(self, model, messages, **kwargs):
+            content = messages[0]["content"]
+            prompts.append(content)
+            n = content.count("## Text ")
+            reply = json.dumps([0.5] * n)
+            return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=reply))])
+
+    class Client:
+        llm_api_key = "dummy"
+        sentiment_model = "model-a"
+        llm_client = FakeOpenAI()
+
+    rs = ResultSet([Result(url_hash=f"h{i}", content=f"text {i}") for i in range(5)])
+    cache_path = str(tmp_path / "sentiment.sqlite")
+
+    assert rs.sentiment(Client(), batch_size=2, concurrency=2, cache=True, cache_path=cache_path) == [0.5] * 5
+    assert len(prompts) == 3
+
+    # Everything is cached now, so no further LLM calls are made.
+    assert rs.sentiment(Client(), batch_size=2, cache=True, cache_path=cache_path) == [0.5] * 5
+    assert len(prompts) == 3
+
+    # Caching is opt-in.
+    assert rs.sentiment(Client(), batch_size=2) == [0.5] * 5
+    assert len(prompts) == 6
+
+    with pytest.raises(ValueError):
+        rs.sentiment(None)
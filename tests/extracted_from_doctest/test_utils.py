@@ -51,8 +51,8 @@ def test_json_dumps_orjson_path(monkeypatch):
     # fake orjson.dumps to mimic real behavior: returns bytes of JSON
     class FakeOrjson:
         @staticmethod
-        def dumps(o):
-            # Convert keys to str like orjson does
+        def dumps(o, option=None):
+            # Convert keys to str like orjson does with OPT_NON_STR_KEYS
             def convert_keys(obj):
                 if isinstance(obj, dict):
                     return {str(k): convert_keys(v) for k, v in obj.items()}
@@ -132,6 +132,16 @@ def test_print_dict_indent(monkeypatch):
     assert '"z": 9' in s2
 
 
+def test_json_dumps_bytes_is_compact_on_both_paths(monkeypatch):
+    payload = {"q": "é", 1: [1, 2]}
+    fast = jt.json_dumps_bytes(payload)
+    monkeypatch.setattr(jt, "_use_orjson", False)
+    slow = jt.json_dumps_bytes({"q": "é", "1": [1, 2]})
+    assert isinstance(fast, bytes) and isinstance(slow, bytes)
+    assert json.loads(fast) == json.loads(slow) == {"q": "é", "1": [1, 2]}
+    assert b" " not in slow
+
+
 def test_rate_limiter_try_acquire_and_block(monkeypatch):
     # small window so we don't wait too long
     rl = RateLimiter(max_calls=1, period_s=0.1)
@@ -150,6 +160,98 @@ def test_rate_limiter_try_acquire_and_block(monkeypatch):
     assert round(elapsed, 2) >= 0.01
 
 
+def test_rate_limiter_adapts_to_server_feedback():
+    rl = RateLimiter(max_calls=100, period_s=1.0)
+    rl.penalize(retry_after=0.05)
+    assert rl.factor == 0.5
+    # Blocked until Retry-After has passed.
+    assert rl.try_acquire() is False
+    start = time.perf_counter()
+    rl.acquire()
+    assert time.perf_counter() - start >= 0.04
+    # Successes climb back to the full rate.
+    for _ in range(100):
+        rl.reward()
+    assert rl.factor == 1.0
+
+
+def test_rate_limiter_sqlite_backend_is_shared(tmp_path):
+    db = str(tmp_path / "limits.sqlite")
+    first = RateLimiter(max_calls=2, period_s=60, backend="sqlite", db_path=db, name="key_fast_60")
+    second = RateLimiter(max_calls=2, period_s=60, backend="sqlite", db_path=db, name="key_fast_60")
+    other = RateLimiter(max_calls=2, period_s=60, backend="sqlite", db_path=db, name="key_bulk_60")
+    assert first.try_acquire() is True
+    assert second.try_acquire() is True
+    # Both limiters draw from the same budget; other names are independent.
+    assert first.try_acquire() is False
+    assert second.try_acquire() is False
+    assert other.try_acquire() is True
+
+    with pytest.raises(ValueError, match=r"\.sqlite"):
+        RateLimiter(max_calls=2, period_s=60, backend="sqlite", db_path=str(tmp_path / "limits.db"))
+
+
+def test_rate_limiter_timeout_async_and_atomic_windows():
+    import asyncio
+
+    rl = RateLimiter(max_calls=1, period_s=0.05, windows=[(2, 3600)])
+    assert rl.try_acquire() is True
+    asyncio.run(rl.acquire_async(timeout=0.5))
+    # The hourly window is full: fail fast rather than sleep for up to an hour.
+    start = time.perf_counter()
+    with pytest.raises(TimeoutError):
+        rl.acquire(timeout=1.0)
+    with pytest.raises(TimeoutError):
+        asyncio.run(rl.acquire_async(timeout=1.0))
+    assert time.perf_counter() - start < 0.5
+
+
+def test_rate_limiter_serves_urgent_waiters_first():
+    from nosible.utils.scheduling import PRIORITY_BATCH, PRIORITY_INTERACTIVE, PriorityExecutor
+
+    rl = RateLimiter(max_calls=1, period_s=0.3)
+    rl.acquire()
+    order = []
+
+    def wait_for_slot(label):
+        rl.acquire()
+        order.append(label)
+
+    with PriorityExecutor(max_workers=2) as pool:
+        pool.submit(wait_for_slot, "batch", priority=PRIORITY_BATCH)
+        time.sleep(0.05)
+        pool.submit(wait_for_slot, "interactive", priority=PRIORITY_INTERACTIVE)
+    assert order == ["interactive", "batch"]
+
+
+def test_priority_executor_reuses_idle_workers_and_joins_at_exit(tmp_path):
+    import subprocess
+    import sys
+
+    from nosible.utils.scheduling import PriorityExecutor
+
+    pool = PriorityExecutor(max_workers=4)
+    for i in range(5):
+        assert pool.submit(pow, i, 2).result() == i * i
+    # Sequential work never needs more than one worker.
+    assert len(pool._threads) == 1
+    assert not pool._threads[0].daemon
+    pool.shutdown()
+    assert not pool._threads[0].is_alive()
+
+    # An executor that is never shut down still finishes its queue before the interpreter exits.
+    marker = tmp_path / "done"
+    script = (
+        "import pathlib, time\n"
+        "from nosible.utils.scheduling import PriorityExecutor\n"
+        "pool = PriorityExecutor(max_workers=1)\n"
+        "pool.submit(time.sleep, 0.2)\n"
+        f"pool.submit(pathlib.Path({str(marker)!r}).touch)\n"
+    )
+    subprocess.run([sys.executable, "-c", script], check=True, timeout=30)
+    assert marker.exists()
+
+
 def test_rate_limited_decorator_calls_all_limiters():
     calls = []
 
@@ -176,3 +278,29 @@ def test_rate_limited_decorator_calls_all_limiters():
     assert result == 6
     # ensure both limiters had acquire() called once
     assert calls == ["acq", "acq"]
+
+
+def test_disk_cache_roundtrip_and_ttl(tmp_path):
+    from nosible.utils.disk_cache import DiskCache
+
+    path = str(tmp_path / "nested" / "cache.sqlite")
+    cache = DiskCache(path)
+    cache.set_many({"a": [1, 2], "b": {"x": 1.5}})
+    assert cache.get("a") == [1, 2]
+    assert cache.get_many(["a", "b", "c"]) == {"a": [1, 2], "b": {"x": 1.5}}
+    cache.close()
+
+    # A second handle on the same file sees the entries; a zero TTL expires them.
+    assert DiskCache(path).get("b") == {"x": 1.5}
+    assert DiskCache(path, ttl=0).get("b") is None
+
+
+def test_json_dumps_serializes_dataclasses_directly(monkeypatch):
+    from nosible import Result
+
+    payload = {1: [Result(url="https://a.com", similarity=0.5)], "n": None}
+    fast = jt.json_dumps_bytes(payload)
+    assert json.loads(fast) == {"1": [Result(url="https://a.com", similarity=0.5).to_dict()], "n": None}
+    monkeypatch.setattr(jt, "_use_orjson", False)
+    assert jt.json_dumps_bytes(payload) == fast
+    assert jt.json_dumps(payload) == fast.decode("utf-8")
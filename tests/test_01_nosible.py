@@ -80,6 +80,16 @@ def test_invalid_api_key():
         Nosible(nosible_api_key="test+|xyz")
 
 
+def test_rate_limit_db_must_be_sqlite_file():
+    with pytest.raises(ValueError, match=r"\.sqlite"):
+        Nosible(nosible_api_key="test|xyz", rate_limit_backend="sqlite", rate_limit_db="limits.db")
+
+
+def test_rate_limit_backend_is_validated_up_front():
+    with pytest.raises(ValueError, match="Unknown rate limit backend"):
+        Nosible(nosible_api_key="test|xyz", rate_limit_backend="redis")
+
+
 def test_llm_key_required_for_expansions():
     nos = Nosible(llm_api_key=None)
     nos.llm_api_key = None
@@ -87,11 +97,321 @@ def test_llm_key_required_for_expansions():
         nos._generate_expansions("anything")
 
 
+def test_llm_client_is_pooled():
+    nos = Nosible(nosible_api_key="test|xyz", llm_api_key="sk-test")
+    client = nos.llm_client
+    assert nos.llm_client is client
+    assert str(client.base_url).startswith(nos.openai_base_url)
+    async_client = nos.async_llm_client
+    assert nos.async_llm_client is async_client
+    nos.close()
+    assert nos._llm_client is None and nos._async_llm_client is None
+    assert client.is_closed() and async_client.is_closed()
+
+
+def test_async_llm_client_is_closed_from_async_code():
+    import asyncio
+
+    async def main():
+        # Awaited by aclose / async with.
+        async with Nosible(nosible_api_key="test|xyz", llm_api_key="sk-test") as nos:
+            awaited = nos.async_llm_client
+        # Scheduled on the running loop by a plain close().
+        nos = Nosible(nosible_api_key="test|xyz", llm_api_key="sk-test")
+        scheduled = nos.async_llm_client
+        nos.close()
+        await asyncio.sleep(0)
+        return awaited, scheduled
+
+    awaited, scheduled = asyncio.run(main())
+    assert awaited.is_closed() and scheduled.is_closed()
+
+
+def test_expansions_are_cached_and_prewarmed(tmp_path, monkeypatch):
+    monkeypatch.setenv("NOSIBLE_CACHE_DIR", str(tmp_path))
+    calls = []
+
+    def fake_request(question):
+        calls.append(question)
+        return [f"{question} {i}" for i in range(10)]
+
+    # Nothing is written to disk unless the cache is enabled.
+    nos = Nosible(nosible_api_key="test|xyz", llm_api_key="sk-test")
+    nos._request_expansions = fake_request
+    nos._generate_expansions("a")
+    nos.close()
+    assert not (tmp_path / "expansions.sqlite").exists()
+    calls.clear()
+
+    nos = Nosible(nosible_api_key="test|xyz", llm_api_key="sk-test", cache_expansions=True)
+    nos._request_expansions = fake_request
+    warmed = nos.prewarm_expansions([Search(question="a"), Search(question="b"), "a"])
+    assert sorted(warmed) == ["a", "b"]
+    assert sorted(calls) == ["a", "b"]
+    assert nos._generate_expansions("a") == warmed["a"]
+    assert len(calls) == 2
+    nos.close()
+
+    # A new client reuses the on-disk cache, but not across models.
+    nos = Nosible(nosible_api_key="test|xyz", llm_api_key="sk-test", expansions_model="other", cache_expansions=True)
+    nos._request_expansions = fake_request
+    nos._generate_expansions("a")
+    assert len(calls) == 3
+    nos.close()
+
+
+def test_fast_searches_expands_before_dispatch():
+    nos = Nosible(nosible_api_key="test|xyz", llm_api_key="sk-test")
+    nos._generate_expansions = lambda question: [f"{question} {i}" for i in range(10)]
+    seen = []
+
+    def fake_search(search_obj):
+        seen.append(search_obj)
+        return ResultSet([Result(title=search_obj.question)])
+
+    nos._search_single = fake_search
+    out = list(nos.fast_searches(questions=["a", "b", "c"], autogenerate_expansions=True))
+    assert [r[0].title for r in out] == ["a", "b", "c"]
+    assert all(not s.autogenerate_expansions and len(s.expansions) == 10 for s in seen)
+    nos.close()
+
+
+def test_answer_stream_yields_tokens_within_budget():
+    from types import SimpleNamespace
+
+    nos = Nosible(nosible_api_key="test|xyz", llm_api_key="sk-test")
+    docs = ResultSet(
+        [Result(title=f"Doc {i}", similarity=i / 10, url=f"https://{i}.com", content="z" * 1000) for i in range(5)]
+    )
+    nos.fast_search = lambda **kwargs: docs
+    prompts = []
+
+    def create(model, messages, stream=False):
+        prompts.append(messages[0]["content"])
+        assert stream
+        return iter(SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=t))]) for t in ["Hel", "lo"])
+
+    nos._llm_client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+    assert "".join(nos.answer_stream("q", max_context_tokens=300)) == "Hello"
+    # Only the most similar documents fit in the ~1200 character budget.
+    assert "https://4.com" in prompts[0] and "https://0.com" not in prompts[0]
+
+
+def test_answers_pipelines_search_and_llm():
+    from types import SimpleNamespace
+
+    nos = Nosible(nosible_api_key="test|xyz", llm_api_key="sk-test")
+
+    def fake_search(search_obj):
+        if search_obj.question == "bad":
+            raise ValueError("boom")
+        return ResultSet([Result(title=search_obj.question, similarity=0.9, content="text")])
+
+    def create(model, messages):
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content="42"))])
+
+    nos._search_single = fake_search
+    nos._llm_client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+    out = {item["query"]: item for item in nos.answers(["a", "bad", "c"], concurrency=2)}
+    assert sorted(out) == ["a", "bad", "c"]
+    assert out["a"]["answer"] == "Answer:\n42" and out["a"]["error"] is None
+    assert out["a"]["search_seconds"] >= 0 and out["a"]["llm_seconds"] >= 0
+    assert isinstance(out["bad"]["error"], ValueError) and out["bad"]["answer"] is None
+
+
+def test_post_retries_after_429():
+    import httpx
+
+    from nosible.utils.rate_limiter import RateLimitError
+
+    statuses = iter([429, 200])
+
+    def handler(request):
+        status = next(statuses)
+        return httpx.Response(status, headers={"Retry-After": "0"} if status == 429 else {}, json={"response": []})
+
+    nos = Nosible(nosible_api_key="test|xyz")
+    nos._session = httpx.Client(transport=httpx.MockTransport(handler))
+    resp = nos._post(url="https://www.nosible.ai/search/v2/fast-search", payload={})
+    assert resp.status_code == 200
+    limiter = nos._adaptive_limiter("https://www.nosible.ai/search/v2/fast-search")
+    assert 0.5 < limiter.factor < 1.0
+
+    nos._session = httpx.Client(transport=httpx.MockTransport(lambda r: httpx.Response(429)))
+    with pytest.raises(RateLimitError):
+        nos._post.retry_with(stop=lambda state: True)(url="https://www.nosible.ai/search/v2/fast-search", payload={})
+
+
+def test_quota_status_persists_across_clients(tmp_path, monkeypatch):
+    import httpx
+
+    monkeypatch.setenv("NOSIBLE_CACHE_DIR", str(tmp_path))
+    untracked = Nosible(nosible_api_key="test|xyz")
+    untracked._session = httpx.Client(transport=httpx.MockTransport(lambda r: httpx.Response(200, json={})))
+    untracked._post(url="https://www.nosible.ai/search/v2/fast-search", payload={})
+    untracked.close()
+    assert not (tmp_path / "quota.sqlite").exists()
+
+    nos = Nosible(nosible_api_key="test|xyz", track_quota=True)
+    nos._session = httpx.Client(transport=httpx.MockTransport(lambda r: httpx.Response(200, json={})))
+    for _ in range(3):
+        nos._post(url="https://www.nosible.ai/search/v2/fast-search", payload={})
+    nos.close()
+
+    restarted = Nosible(nosible_api_key="test|xyz", track_quota=True)
+    status = restarted.quota_status()
+    assert status["fast"]["used"] == 3
+    assert status["fast"]["remaining"] == status["fast"]["limit"] - 3
+    assert status["fast"]["projected_exhaustion"] is not None
+    assert status["bulk"]["used"] == 0 and status["bulk"]["projected_exhaustion"] is None
+    # The monthly window of a new client's limiter starts from the recorded usage.
+    assert restarted._limiters["fast"][0]._bucket.count() == 3
+    restarted.close()
+
+
+def test_interactive_searches_jump_the_batch_queue():
+    import threading
+
+    nos = Nosible(nosible_api_key="test|xyz", concurrency=1)
+    gate = threading.Event()
+    order = []
+
+    def fake_search(search_obj):
+        gate.wait()
+        order.append(search_obj.question)
+        return ResultSet()
+
+    nos._search_single = fake_search
+    batch = nos.fast_searches(questions=["b1", "b2", "b3"])
+    worker = threading.Thread(target=lambda: list(batch))
+    worker.start()
+    time.sleep(0.1)
+    interactive = threading.Thread(target=lambda: nos.fast_search(question="now"))
+    interactive.start()
+    time.sleep(0.1)
+    gate.set()
+    worker.join()
+    interactive.join()
+    # b1 was already running; the interactive search runs before the queued batch.
+    assert order == ["b1", "now", "b2", "b3"]
+    nos.close()
+
+
+def test_post_waits_and_retries_after_409():
+    import httpx
+
+    statuses = iter([409, 409, 200])
+    nos = Nosible(nosible_api_key="test|xyz")
+    nos._session = httpx.Client(transport=httpx.MockTransport(lambda r: httpx.Response(next(statuses), json={})))
+    limiter = nos._concurrency_limiters["fast"]
+    limiter.wait_for_release = lambda timeout: False
+    rate_limiter = nos._limiters["fast"][0]
+    resp = nos._post(url="https://www.nosible.ai/search/v2/fast-search", payload={})
+    assert resp.status_code == 200
+    # Both resends drew from the rate limit.
+    assert rate_limiter._bucket.count() == 2
+    # Cut to one slot by the 409s, then grown by one after the success.
+    assert limiter.limit == 2 and limiter.in_flight == 0
+    assert nos._concurrency_limiters["bulk"].limit == 1
+
+
+def test_http2_fallback_and_prewarm(monkeypatch):
+    import importlib.util
+
+    import httpx
+
+    real_find_spec = importlib.util.find_spec
+    monkeypatch.setattr(importlib.util, "find_spec", lambda name: None if name == "h2" else real_find_spec(name))
+    with pytest.warns(UserWarning, match="HTTP/2 requires"):
+        nos = Nosible(nosible_api_key="test|xyz", http2=True)
+    assert nos.http2 is False
+
+    nos._session = httpx.Client(transport=httpx.MockTransport(lambda r: httpx.Response(200)))
+    assert nos.prewarm(connections=3) == 3
+    nos.close()
+
+
+def test_post_compresses_large_bodies():
+    import gzip
+
+    import httpx
+
+    seen = []
+
+    def handler(request):
+        seen.append(request)
+        return httpx.Response(200, json={})
+
+    nos = Nosible(nosible_api_key="test|xyz", request_compression="gzip", compression_threshold=1000)
+    nos._session = httpx.Client(transport=httpx.MockTransport(handler))
+    nos._post(url="https://www.nosible.ai/search/v2/scrape-url", payload={"html": "<p>x</p>" * 500})
+    nos._post(url="https://www.nosible.ai/search/v2/scrape-url", payload={"url": "https://a.com"})
+    big, small = seen
+    assert big.headers["Content-Encoding"] == "gzip"
+    assert json.loads(gzip.decompress(big.content)) == {"html": "<p>x</p>" * 500}
+    assert "Content-Encoding" not in small.headers and json.loads(small.content) == {"url": "https://a.com"}
+    assert small.headers["Content-Type"] == "application/json"
+
+    with pytest.raises(ValueError, match="Unsupported request compression"):
+        Nosible(nosible_api_key="test|xyz", request_compression="br")
+
+
+def test_malformed_json_responses_raise_value_errors():
+    import httpx
+
+    nos = Nosible(nosible_api_key="test|xyz")
+    nos._session = httpx.Client(transport=httpx.MockTransport(lambda r: httpx.Response(200, content=b"<html>")))
+    resp = nos._post(url="https://www.nosible.ai/search/v2/topic-trend", payload={})
+    with pytest.raises(json.JSONDecodeError):
+        Nosible._decode_json(resp)
+    with pytest.raises(ValueError):
+        ResultSet.from_json(resp.content)
+
+    # _post decodes 422 bodies itself.
+    nos._session = httpx.Client(
+        transport=httpx.MockTransport(
+            lambda r: httpx.Response(422, content=b"{oops", headers={"Content-Type": "application/json"})
+        )
+    )
+    with pytest.raises(ValueError):
+        nos._post(url="https://www.nosible.ai/search/v2/fast-search", payload={})
+    nos.close()
+
+
 def test_validate_sql():
     assert Nosible()._validate_sql(sql="SELECT 1")
     assert not Nosible()._validate_sql(sql="SELECT * FROM missing_table")
 
 
+def test_validate_sql_is_memoized():
+    from nosible.nosible_client import _sql_is_valid
+
+    nos = Nosible()
+    sql = nos._format_sql(include_companies=["/m/0abc"], include_docs=["ENNmqkF1mGNhVhvhmbUEs4U2"])
+    assert "doc_hash IN" in sql
+    hits = _sql_is_valid.cache_info().hits
+    assert nos._validate_sql(sql)
+    assert _sql_is_valid.cache_info().hits == hits + 1
+
+
+def test_format_sql_is_memoized(monkeypatch):
+    nos = Nosible()
+    hits = Nosible._compile_sql.cache_info().hits
+    first = nos._format_sql(publish_start="2024-01-01", include_netlocs=["a.com", "b.com"])
+    second = nos._format_sql(publish_start="2024-01-01", include_netlocs=["a.com", "b.com"])
+    assert first == second
+    assert Nosible._compile_sql.cache_info().hits == hits + 1
+    # Cache hits are still logged by the client.
+    logged = []
+    monkeypatch.setattr(nos.logger, "debug", logged.append)
+    nos._format_sql(publish_start="2024-01-01", include_netlocs=["a.com", "b.com"])
+    assert logged == [f"Generated SQL filter: {first}"]
+    # Invalid filters are not cached: they raise every time.
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            nos._format_sql(publish_start="2024-13-01")
+
+
 # —— Your additional tests —— #
 
 
@@ -217,4 +537,61 @@ def test_answer_raises_if_no_llm_key(search_data):
     nos = Nosible(nosible_api_key="test|xyz", llm_api_key=None)
     nos.llm_api_key = None
     with pytest.raises(ValueError, match="LLM API key"):
-        nos.answer("Anything", n_results=1)
\ No newline at end of file
+        nos.answer("Anything", n_results=1)
+
+
+def test_import_nosible_defers_heavy_dependencies():
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, nosible\n"
+        "deferred = ('nosible.nosible_client', 'httpx', 'tenacity', 'pyrate_limiter', 'polars', 'cryptography')\n"
+        "print(' '.join(m for m in deferred if m in sys.modules))\n"
+        "from nosible import Nosible, ResultSet\n"
+        "print(' '.join(m for m in ('tenacity', 'pyrate_limiter', 'asyncio') if m in sys.modules))\n"
+    )
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    eager, after_client = out.split("\n")[:2]
+    assert eager == ""
+    assert after_client == ""
+
+
+def test_client_resources_are_lazy_and_shareable():
+    from concurrent.futures import ThreadPoolExecutor
+
+    nos = Nosible(nosible_api_key="test|lazy")
+    assert not {"_session", "_executor", "_limiters", "_post"} & set(vars(nos))
+    # Probing unknown attributes does not build anything.
+    assert not hasattr(nos, "_sesion")
+    assert "_session" not in nos._resources.values
+    # Concurrent first use builds each resource once.
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        sessions = set(map(id, pool.map(lambda _: nos._session, range(32))))
+    assert len(sessions) == 1
+    nos.close()
+    # A closed client does not quietly rebuild its resources.
+    with pytest.raises(RuntimeError, match="closed"):
+        nos._session
+    with pytest.raises(RuntimeError, match="closed"):
+        nos.fast_search(question="anything")
+    nos.close()
+
+    a = Nosible(nosible_api_key="test|shared", share_resources=True)
+    b = Nosible(nosible_api_key="test|shared", share_resources=True)
+    c = Nosible(nosible_api_key="test|shared")
+    d = Nosible(nosible_api_key="test|shared", share_resources=True, track_quota=True)
+    e = Nosible(nosible_api_key="test|shared", share_resources=True, rate_limit_timeout=1.0)
+    assert a._session is b._session and a._executor is b._executor and a._limiters is b._limiters
+    assert c._session is not a._session
+    # Clients whose limiters are configured differently get their own.
+    assert d._resources is not a._resources and e._resources is not a._resources
+    d.close()
+    e.close()
+    assert a._post is not b._post
+    session = b._session
+    a.close()
+    assert not session.is_closed
+    b.close()
+    assert session.is_closed
+    c.close()